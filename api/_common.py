@@ -0,0 +1,199 @@
+from http.server import BaseHTTPRequestHandler
+import asyncio
+import concurrent.futures
+import json
+import os
+import queue
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json with the same bytes-in/bytes-out interface
+    class orjson:
+        @staticmethod
+        def loads(data):
+            return json.loads(bytes(data))
+
+        @staticmethod
+        def dumps(data):
+            return json.dumps(data).encode()
+
+# Per-thread request body buffer, reused across POSTs
+_BUF = threading.local()
+
+# Static response headers, serialized once
+_CORS_HEADERS = (
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+    b'Access-Control-Allow-Headers: Content-Type\r\n'
+)
+
+# Long-lived event loop shared by all requests so agent coroutines (and any
+# connection pools they hold) survive between calls
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, daemon=True).start()
+
+# Context snapshot reused across requests for up to _CONTEXT_TTL seconds
+_CONTEXT_TTL = 1.0
+
+# Keep-alive only helps behind a persistent server, not one-shot serverless invocations
+_PROTOCOL_VERSION = "HTTP/1.1" if os.getenv('API_KEEP_ALIVE') == '1' else "HTTP/1.0"
+
+def make_chat_handler(agent_invoke, context_engine, extra_fields=(), stream_invoke=None):
+    """Build a chat endpoint handler class.
+
+    agent_invoke(message, context, session_id) returns the agent coroutine,
+    extra_fields names additional response keys passed through from the agent
+    result and stream_invoke, if given, returns an async generator of text
+    deltas for requests with "stream" set.
+    """
+    context_cache = {'ts': 0.0, 'value': None}
+
+    def get_cached_context():
+        """Get the current context, rebuilding it at most once per _CONTEXT_TTL"""
+        now = time.monotonic()
+        if context_cache['value'] is None or now - context_cache['ts'] >= _CONTEXT_TTL:
+            context_cache['value'] = context_engine.get_context()
+            context_cache['ts'] = now
+        return context_cache['value']
+
+    def invalidate_context():
+        """Drop the cached context after the agent has changed it"""
+        context_cache['value'] = None
+
+    class handler(BaseHTTPRequestHandler):
+        protocol_version = _PROTOCOL_VERSION
+        
+        def do_OPTIONS(self):
+            self.write_response(200)
+            return
+        
+        def do_POST(self):
+            try:
+                content_length = int(self.headers['Content-Length'])
+                buf = getattr(_BUF, 'b', None)
+                if buf is None or len(buf) < content_length:
+                    buf = _BUF.b = bytearray(max(content_length, 8192))
+                mv = memoryview(buf)[:content_length]
+                read = self.rfile.readinto(mv)
+                data = orjson.loads(mv[:read])
+                
+                message = data.get('message', '')
+                session_id = data.get('session_id', 'default')
+                context = data.get('context', {})
+                
+                if not message:
+                    self.send_error_response(400, "Message is required")
+                    return
+                
+                # Get current context
+                current_context = get_cached_context()
+                
+                if stream_invoke is not None and data.get('stream'):
+                    self.send_stream_response(stream_invoke(message, current_context, session_id))
+                    return
+                
+                # Process message with the agent
+                fut = asyncio.run_coroutine_threadsafe(agent_invoke(message, current_context, session_id), _LOOP)
+                try:
+                    response = fut.result(timeout=60)
+                except concurrent.futures.TimeoutError:
+                    fut.cancel()
+                    self.send_error_response(504, "Request timed out")
+                    return
+                
+                if response.get('context_updated'):
+                    invalidate_context()
+                
+                result = {
+                    "success": True,
+                    "response": response['response'],
+                    "actions_taken": response.get('actions_taken', []),
+                    "suggestions": response.get('suggestions', []),
+                }
+                for field in extra_fields:
+                    result[field] = response.get(field, {})
+                result["context"] = current_context
+                self.send_success_response(result)
+            
+            except Exception as e:
+                self.send_error_response(500, str(e))
+        
+        def send_success_response(self, data):
+            self.write_response(200, orjson.dumps(data))
+        
+        def send_error_response(self, status_code, message):
+            self.write_response(status_code, orjson.dumps({"success": False, "error": message}))
+        
+        def send_stream_response(self, deltas):
+            """Relay text deltas from an async generator as server-sent events"""
+            chunks = queue.Queue()
+            
+            async def pump():
+                # The stream ends with None, or with the exception that broke it
+                try:
+                    async for delta in deltas:
+                        chunks.put(delta)
+                except Exception as e:
+                    chunks.put(e)
+                else:
+                    chunks.put(None)
+                finally:
+                    # Release the model's stream even when the client went away
+                    await deltas.aclose()
+            
+            fut = asyncio.run_coroutine_threadsafe(pump(), _LOOP)
+            chunked = self.protocol_version == 'HTTP/1.1' and self.request_version != 'HTTP/1.0'
+            if not chunked:
+                # Without chunked encoding the end of the body is signalled by closing
+                self.close_connection = True
+            
+            self.log_request(200)
+            status_line = '%s 200 OK\r\n' % self.protocol_version
+            # Once the headers are out, failures are reported in the stream
+            # itself; a second response can't be written
+            try:
+                self.wfile.write(
+                    status_line.encode('latin-1')
+                    + b'Content-Type: text/event-stream\r\nCache-Control: no-cache\r\n'
+                    + (b'Transfer-Encoding: chunked\r\n' if chunked else b'Connection: close\r\n')
+                    + _CORS_HEADERS
+                    + b'\r\n'
+                )
+                while True:
+                    try:
+                        delta = chunks.get(timeout=60)
+                    except queue.Empty:
+                        delta = TimeoutError("Stream timed out")
+                    if delta is None:
+                        event = b'data: [DONE]\n\n'
+                    elif isinstance(delta, Exception):
+                        event = b'data: ' + orjson.dumps({'error': str(delta)}) + b'\n\n'
+                    else:
+                        event = b'data: ' + orjson.dumps({'delta': delta}) + b'\n\n'
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(event), event) if chunked else event)
+                    if delta is None or isinstance(delta, Exception):
+                        break
+                if chunked:
+                    self.wfile.write(b'0\r\n\r\n')
+            except OSError:
+                # The client disconnected mid-stream; drop the connection
+                self.close_connection = True
+            finally:
+                fut.cancel()
+        
+        def write_response(self, status_code, body=b''):
+            """Write the status line, headers and body with a single write"""
+            self.log_request(status_code)
+            status_line = '%s %d %s\r\n' % (self.protocol_version, status_code, self.responses[status_code][0])
+            self.wfile.write(
+                status_line.encode('latin-1')
+                + b'Content-Type: application/json\r\nContent-Length: %d\r\n' % len(body)
+                + _CORS_HEADERS
+                + b'\r\n'
+                + body
+            )
+
+    return handler
@@ -4,9 +4,164 @@ Lightweight version without heavy dependencies
 """
 
 import os
+import re
 import json
+import time
+import asyncio
+import hashlib
+from functools import lru_cache
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Mapping, Final
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    import requests.models as _requests_models
+
+    class _OrjsonCompat:
+        """json-module stand-in so Response.json() parses with orjson"""
+        JSONDecodeError = json.JSONDecodeError
+
+        @staticmethod
+        def loads(s, **kwargs):
+            if kwargs:
+                return json.loads(s, **kwargs)
+            return orjson.loads(s)
+
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return json.dumps(obj, **kwargs)
+
+    _requests_models.complexjson = _OrjsonCompat
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Shared HTTP session so consecutive model calls reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Async session, created lazily on the event loop that first uses it
+_AIOHTTP = None
+_AIOHTTP_LOOP = None
+
+def _get_aiohttp_session():
+    """Get the shared aiohttp session for the running event loop"""
+    global _AIOHTTP, _AIOHTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _AIOHTTP is None or _AIOHTTP.closed or _AIOHTTP_LOOP is not loop:
+        _AIOHTTP = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=85)
+        )
+        _AIOHTTP_LOOP = loop
+    return _AIOHTTP
+
+# Short-lived response cache: key -> (monotonic timestamp, response)
+_RESP_CACHE: Dict[bytes, tuple] = {}
+_RESP_CACHE_MAX = 256
+_RESP_CACHE_TTL = 60.0
+
+# Prompts that refer to the present moment always go to the model
+_TIME_RELATIVE = re.compile(r'\b(?:now|today|tonight|tomorrow|yesterday|currently)\b', re.IGNORECASE)
+
+def _cache_key(messages: List[Dict], *params) -> Optional[bytes]:
+    """Fingerprint a model call, or None when the prompt is time-sensitive"""
+    if any(_TIME_RELATIVE.search(message.get('content') or '') for message in messages):
+        return None
+    if orjson is not None:
+        payload = orjson.dumps([messages, params], default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps([messages, params], sort_keys=True, default=str).encode()
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(payload)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+def _cache_get(key: Optional[bytes], ttl: float):
+    """Get a cached response younger than ttl seconds"""
+    entry = _RESP_CACHE.get(key) if key is not None else None
+    if entry is None or time.monotonic() - entry[0] >= ttl:
+        return None
+    return entry[1]
+
+def _cache_put(key: Optional[bytes], value: Any):
+    """Store a response, evicting the oldest entry when full"""
+    if key is None:
+        return
+    if len(_RESP_CACHE) >= _RESP_CACHE_MAX:
+        _RESP_CACHE.pop(next(iter(_RESP_CACHE)), None)
+    _RESP_CACHE[key] = (time.monotonic(), value)
+
+async def _post_json(session: requests.Session, url: str, headers: Dict, data: Dict,
+                     cache_ttl: float = _RESP_CACHE_TTL) -> Dict:
+    """POST a JSON payload without blocking the event loop"""
+    key = None
+    if cache_ttl > 0:
+        key = _cache_key(data['messages'], url, data['model'], data['temperature'], data['max_tokens'])
+        cached = _cache_get(key, cache_ttl)
+        if cached is not None:
+            return cached
+    
+    if aiohttp is None:
+        def post():
+            response = session.post(url, headers=headers, json=data, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        result = await asyncio.to_thread(post)
+    else:
+        async with _get_aiohttp_session().post(url, headers=headers, json=data) as response:
+            response.raise_for_status()
+            result = await response.json(loads=orjson.loads if orjson is not None else json.loads)
+    
+    _cache_put(key, result)
+    return result
+
+@lru_cache(maxsize=32)
+def _tool_name_pattern(names: tuple):
+    """Compile one case-insensitive matcher for a set of tool names"""
+    return re.compile(r'\b(' + '|'.join(re.escape(name) for name in names) + r')\b', re.IGNORECASE)
+
+def _extract_tool_calls(content: str, tools: List[Dict]) -> List[Dict]:
+    """Find tool names mentioned in the model output in a single scan"""
+    names = tuple(tool['name'] for tool in tools)
+    if not names or not content:
+        return []
+    
+    found = {match.group(1).lower() for match in _tool_name_pattern(names).finditer(content)}
+    return [{'name': name, 'arguments': {}} for name in names if name.lower() in found]
+
+async def _stream_json(session: requests.Session, url: str, headers: Dict, data: Dict):
+    """POST a streaming completion request and yield content deltas from the SSE body"""
+    if aiohttp is None:
+        # Without an async client, fall back to one chunk holding the full reply
+        result = await _post_json(session, url, headers, data, 0)
+        yield result['choices'][0]['message']['content']
+        return
+    
+    async with _get_aiohttp_session().post(url, headers=headers, json={**data, 'stream': True}) as response:
+        response.raise_for_status()
+        async for line in response.content:
+            line = line.strip()
+            if not line.startswith(b'data:'):
+                continue
+            payload = line[5:].strip()
+            if payload == b'[DONE]':
+                break
+            delta = json.loads(payload)['choices'][0].get('delta', {}).get('content')
+            if delta:
+                yield delta
 
 class SimpleGLMModel:
     """Simplified GLM model integration for Vercel"""
@@ -14,15 +169,15 @@ class SimpleGLMModel:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://open.bigmodel.cn/api/paas/v4/chat/completions"
+        self.session = _SESSION
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
     
     async def generate_response(self, messages: List[Dict], **kwargs) -> str:
         """Generate a response using GLM model"""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             data = {
                 "model": "glm-4",
                 "messages": messages,
@@ -30,15 +185,29 @@ class SimpleGLMModel:
                 "max_tokens": kwargs.get('max_tokens', 2000)
             }
             
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
+            result = await _post_json(self.session, self.base_url, self._headers, data,
+                                      kwargs.get('cache_ttl', _RESP_CACHE_TTL))
             return result['choices'][0]['message']['content']
             
         except Exception as e:
             return f"I apologize, but I encountered an error: {str(e)}. Please try again."
     
+    async def generate_response_stream(self, messages: List[Dict], **kwargs):
+        """Stream a response from the GLM model as text deltas"""
+        try:
+            data = {
+                "model": "glm-4",
+                "messages": messages,
+                "temperature": kwargs.get('temperature', 0.7),
+                "max_tokens": kwargs.get('max_tokens', 2000)
+            }
+            
+            async for delta in _stream_json(self.session, self.base_url, self._headers, data):
+                yield delta
+            
+        except Exception as e:
+            yield f"I apologize, but I encountered an error: {str(e)}. Please try again."
+    
     async def generate_with_tools(self, messages: List[Dict], tools: List[Dict], **kwargs) -> Dict:
         """Generate a response with tool calling using GLM"""
         try:
@@ -46,13 +215,7 @@ class SimpleGLMModel:
             content = await self.generate_response(messages, **kwargs)
             
             # Simple tool call extraction
-            tool_calls = []
-            for tool in tools:
-                if tool['name'].lower() in content.lower():
-                    tool_calls.append({
-                        'name': tool['name'],
-                        'arguments': {}
-                    })
+            tool_calls = _extract_tool_calls(content, tools)
             
             return {
                 'content': content,
@@ -71,15 +234,15 @@ class SimpleGROQModel:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.session = _SESSION
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
     
     async def generate_response(self, messages: List[Dict], **kwargs) -> str:
         """Generate a response using GROQ model"""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             data = {
                 "model": "llama3-8b-8192",
                 "messages": messages,
@@ -87,28 +250,36 @@ class SimpleGROQModel:
                 "max_tokens": kwargs.get('max_tokens', 2000)
             }
             
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
+            result = await _post_json(self.session, self.base_url, self._headers, data,
+                                      kwargs.get('cache_ttl', _RESP_CACHE_TTL))
             return result['choices'][0]['message']['content']
             
         except Exception as e:
             return f"I apologize, but I encountered an error: {str(e)}. Please try again."
     
+    async def generate_response_stream(self, messages: List[Dict], **kwargs):
+        """Stream a response from the GROQ model as text deltas"""
+        try:
+            data = {
+                "model": "llama3-8b-8192",
+                "messages": messages,
+                "temperature": kwargs.get('temperature', 0.7),
+                "max_tokens": kwargs.get('max_tokens', 2000)
+            }
+            
+            async for delta in _stream_json(self.session, self.base_url, self._headers, data):
+                yield delta
+            
+        except Exception as e:
+            yield f"I apologize, but I encountered an error: {str(e)}. Please try again."
+    
     async def generate_with_tools(self, messages: List[Dict], tools: List[Dict], **kwargs) -> Dict:
         """Generate a response with tool calling using GROQ"""
         try:
             content = await self.generate_response(messages, **kwargs)
             
             # Simple tool call extraction
-            tool_calls = []
-            for tool in tools:
-                if tool['name'].lower() in content.lower():
-                    tool_calls.append({
-                        'name': tool['name'],
-                        'arguments': {}
-                    })
+            tool_calls = _extract_tool_calls(content, tools)
             
             return {
                 'content': content,
@@ -121,52 +292,72 @@ class SimpleGROQModel:
                 'tool_calls': []
             }
 
+def _initialize_models() -> Dict[str, Any]:
+    """Initialize available AI models"""
+    models = {}
+    
+    # GLM Model
+    glm_key = os.getenv('GLM_API_KEY')
+    if glm_key:
+        models['glm'] = SimpleGLMModel(glm_key)
+    
+    # GROQ Model
+    groq_key = os.getenv('GROQ_API_KEY')
+    if groq_key:
+        models['groq'] = SimpleGROQModel(groq_key)
+    
+    return models
+
+# Models configured for this process, fixed at import time
+_MODELS: Final[Mapping[str, Any]] = MappingProxyType(_initialize_models())
+
+async def generate_response(messages: List[Dict], model_name: str = 'glm', **kwargs) -> str:
+    """Generate response using specified model"""
+    model = _MODELS.get(model_name)
+    if not model:
+        return "AI service temporarily unavailable. Please try again later."
+    
+    return await model.generate_response(messages, **kwargs)
+
+async def generate_with_tools(messages: List[Dict], tools: List[Dict], 
+                              model_name: str = 'glm', **kwargs) -> Dict:
+    """Generate response with tools using specified model"""
+    model = _MODELS.get(model_name)
+    if not model:
+        return {
+            'content': "AI service temporarily unavailable. Please try again later.",
+            'tool_calls': []
+        }
+    
+    return await model.generate_with_tools(messages, tools, **kwargs)
+
+async def generate_response_stream(messages: List[Dict], model_name: str = 'glm', **kwargs):
+    """Stream a response from the specified model as text deltas"""
+    model = _MODELS.get(model_name)
+    if not model:
+        yield "AI service temporarily unavailable. Please try again later."
+        return
+    
+    async for delta in model.generate_response_stream(messages, **kwargs):
+        yield delta
+
 class SimpleModelManager:
-    """Simplified model manager for Vercel deployment"""
+    """Backward-compatible facade over the module-level model registry"""
+    
+    generate_response = staticmethod(generate_response)
+    generate_with_tools = staticmethod(generate_with_tools)
+    generate_response_stream = staticmethod(generate_response_stream)
     
     def __init__(self):
-        self.models = {}
-        self._initialize_models()
-    
-    def _initialize_models(self):
-        """Initialize available AI models"""
-        # GLM Model
-        glm_key = os.getenv('GLM_API_KEY')
-        if glm_key:
-            self.models['glm'] = SimpleGLMModel(glm_key)
-        
-        # GROQ Model
-        groq_key = os.getenv('GROQ_API_KEY')
-        if groq_key:
-            self.models['groq'] = SimpleGROQModel(groq_key)
+        self.models = _MODELS
     
     def get_model(self, model_name: str = 'glm'):
         """Get a specific AI model"""
-        return self.models.get(model_name)
+        return _MODELS.get(model_name)
     
     def get_available_models(self):
         """Get list of available models"""
-        return list(self.models.keys())
-    
-    async def generate_response(self, messages: List[Dict], model_name: str = 'glm', **kwargs) -> str:
-        """Generate response using specified model"""
-        model = self.get_model(model_name)
-        if not model:
-            return "AI service temporarily unavailable. Please try again later."
-        
-        return await model.generate_response(messages, **kwargs)
-    
-    async def generate_with_tools(self, messages: List[Dict], tools: List[Dict], 
-                                model_name: str = 'glm', **kwargs) -> Dict:
-        """Generate response with tools using specified model"""
-        model = self.get_model(model_name)
-        if not model:
-            return {
-                'content': "AI service temporarily unavailable. Please try again later.",
-                'tool_calls': []
-            }
-        
-        return await model.generate_with_tools(messages, tools, **kwargs)
+        return list(_MODELS.keys())
 
 # Global model manager instance
 model_manager = SimpleModelManager()
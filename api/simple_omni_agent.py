@@ -55,14 +55,12 @@ class SimpleOmniAgent:
         ]
         return tools
     
-    async def process_message(self, message: str, context: Dict, session_id: str) -> Dict:
-        """Process a user message and return response with actions"""
-        try:
-            # Prepare messages for AI model
-            messages = [
-                {
-                    "role": "system",
-                    "content": """You are Omni, the Universal Life Connector - an advanced AI assistant that eliminates digital fragmentation.
+    def _build_messages(self, message: str, context: Dict) -> List[Dict]:
+        """Build the model prompt for a user message and its context"""
+        return [
+            {
+                "role": "system",
+                "content": """You are Omni, the Universal Life Connector - an advanced AI assistant that eliminates digital fragmentation.
 
 MISSION: Transform chaotic digital life into unified, intelligent harmony.
 
@@ -95,10 +93,10 @@ When executing tasks:
 - Provide clear feedback on actions taken
 
 Remember: You're not just managing tasks - you're orchestrating a better digital life."""
-                },
-                {
-                    "role": "user",
-                    "content": f"""
+            },
+            {
+                "role": "user",
+                "content": f"""
 User Message: {message}
 
 Current Context:
@@ -110,8 +108,24 @@ Current Context:
 
 Please help the user with their request, considering their current context and providing actionable solutions.
 """
-                }
-            ]
+            }
+        ]
+    
+    async def process_message_stream(self, message: str, context: Dict, session_id: str):
+        """Stream the reply to a user message as text deltas (tools are not invoked)"""
+        async for delta in self.model_manager.generate_response_stream(
+            messages=self._build_messages(message, context),
+            model_name='glm',
+            temperature=0.3,
+            max_tokens=2000
+        ):
+            yield delta
+    
+    async def process_message(self, message: str, context: Dict, session_id: str) -> Dict:
+        """Process a user message and return response with actions"""
+        try:
+            # Prepare messages for AI model
+            messages = self._build_messages(message, context)
             
             # Convert tools to the format expected by our AI models
             tools_for_ai = []
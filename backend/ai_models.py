@@ -4,35 +4,150 @@ Supports GLM, GROQ, and other AI models for the Omni agent
 """
 
 import os
+import re
 import json
-from typing import Dict, List, Any, Optional
-from abc import ABC, abstractmethod
+import time
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Mapping, Final
 import requests
+import httpx
 import zhipuai
-from groq import Groq
+from groq import Groq, GroqError
 
-class AIModel(ABC):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# One pooled HTTP client shared by both model SDKs so they reuse connections
+_HTTP = httpx.Client(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=httpx.Timeout(60.0)
+)
+
+# The model SDKs are blocking, so their calls run on a bounded pool off the event loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=64, thread_name_prefix='omni-model')
+
+async def _call_sdk(fn, **kwargs):
+    """Run a blocking SDK call on the model thread pool"""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, partial(fn, **kwargs))
+
+_STREAM_END = object()
+
+async def _iterate_sdk(iterator):
+    """Pull items from a blocking SDK stream on the model thread pool"""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await loop.run_in_executor(_EXECUTOR, next, iterator, _STREAM_END)
+        if item is _STREAM_END:
+            return
+        yield item
+
+def _stream_delta(chunk) -> Optional[str]:
+    """Get the text delta from a streamed completion chunk"""
+    return chunk.choices[0].delta.content if chunk.choices else None
+
+# Short-lived response cache: key -> (monotonic timestamp, response)
+_RESP_CACHE: Dict[bytes, tuple] = {}
+_RESP_CACHE_MAX = 256
+_RESP_CACHE_TTL = 60.0
+
+# Prompts that refer to the present moment always go to the model
+_TIME_RELATIVE = re.compile(r'\b(?:now|today|tonight|tomorrow|yesterday|currently)\b', re.IGNORECASE)
+
+def _cache_key(messages: List[Dict], *params) -> Optional[bytes]:
+    """Fingerprint a model call, or None when the prompt is time-sensitive"""
+    if any(_TIME_RELATIVE.search(message.get('content') or '') for message in messages):
+        return None
+    if orjson is not None:
+        payload = orjson.dumps([messages, params], default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps([messages, params], sort_keys=True, default=str).encode()
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(payload)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+def _cache_get(key: Optional[bytes], ttl: float):
+    """Get a cached response younger than ttl seconds"""
+    entry = _RESP_CACHE.get(key) if key is not None else None
+    if entry is None or time.monotonic() - entry[0] >= ttl:
+        return None
+    return entry[1]
+
+def _cache_put(key: Optional[bytes], value: Any):
+    """Store a response, evicting the oldest entry when full"""
+    if key is None:
+        return
+    if len(_RESP_CACHE) >= _RESP_CACHE_MAX:
+        _RESP_CACHE.pop(next(iter(_RESP_CACHE)), None)
+    _RESP_CACHE[key] = (time.monotonic(), value)
+
+# Provider options passed through only when a caller sets them
+_OPTIONAL_PARAMS = ('response_format',)
+
+def _optional_params(kwargs: Dict) -> Dict:
+    """Pick the provider options a caller set explicitly"""
+    return {name: kwargs[name] for name in _OPTIONAL_PARAMS if name in kwargs}
+
+_ROLE_PREFIX = {'system': 'System: ', 'user': 'Human: ', 'assistant': 'Assistant: '}
+
+@lru_cache(maxsize=128)
+def _format_prompt(turns: tuple) -> str:
+    """Join (role, content) turns into the GLM prompt format"""
+    return "\n\n".join(f"{_ROLE_PREFIX[role]}{content}" for role, content in turns if role in _ROLE_PREFIX)
+
+@lru_cache(maxsize=32)
+def _format_tool_prompt(tools: tuple) -> str:
+    """Build the available-tools prompt section from (name, description) pairs"""
+    tool_descriptions = "\n".join(f"- {name}: {description}" for name, description in tools)
+    return f"""
+Available tools:
+{tool_descriptions}
+
+Please respond with your answer and indicate if you want to use any tools.
+"""
+
+@lru_cache(maxsize=32)
+def _tool_call_pattern(names: tuple):
+    """Compile one matcher for "use <tool>" / "call <tool>" over a set of tool names"""
+    return re.compile(r'(?:use|call)\s+(' + '|'.join(re.escape(name) for name in names) + r')\b', re.IGNORECASE)
+
+class AIModel:
     """Base class for AI model integrations"""
+    __slots__ = ('api_key',)
     
     def __init__(self, api_key: str):
         self.api_key = api_key
     
-    @abstractmethod
     async def generate_response(self, messages: List[Dict], **kwargs) -> str:
         """Generate a response from the AI model"""
-        pass
+        raise NotImplementedError
+    
+    async def generate_response_stream(self, messages: List[Dict], **kwargs):
+        """Stream a response from the AI model as text deltas"""
+        # Models without a streaming API send the whole reply as one delta
+        yield await self.generate_response(messages, **kwargs)
     
-    @abstractmethod
     async def generate_with_tools(self, messages: List[Dict], tools: List[Dict], **kwargs) -> Dict:
         """Generate a response with tool calling capabilities"""
-        pass
+        raise NotImplementedError
 
 class GLMModel(AIModel):
     """GLM (Zhipu AI) model integration"""
+    __slots__ = ('client',)
     
     def __init__(self, api_key: str):
         super().__init__(api_key)
-        zhipuai.api_key = api_key
+        self.client = zhipuai.ZhipuAI(api_key=api_key, http_client=_HTTP)
     
     async def generate_response(self, messages: List[Dict], **kwargs) -> str:
         """Generate a response using GLM model"""
@@ -40,20 +155,42 @@ class GLMModel(AIModel):
             # Convert messages to GLM format
             prompt = self._convert_messages_to_prompt(messages)
             
-            response = zhipuai.model_api.invoke(
+            response = await _call_sdk(
+                self.client.chat.completions.create,
                 model="glm-4",
-                prompt=prompt,
+                messages=[{"role": "user", "content": prompt}],
                 temperature=kwargs.get('temperature', 0.7),
                 max_tokens=kwargs.get('max_tokens', 2000),
+                **_optional_params(kwargs),
             )
             
-            if response['code'] == 200:
-                return response['data']['choices'][0]['message']['content']
-            else:
-                raise Exception(f"GLM API error: {response['msg']}")
+            return response.choices[0].message.content
                 
-        except Exception as e:
-            raise Exception(f"Error calling GLM API: {str(e)}")
+        except (zhipuai.ZhipuAIError, KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Error calling GLM API: {str(e)}") from e
+    
+    async def generate_response_stream(self, messages: List[Dict], **kwargs):
+        """Stream a response from the GLM model as text deltas"""
+        try:
+            prompt = self._convert_messages_to_prompt(messages)
+            
+            stream = await _call_sdk(
+                self.client.chat.completions.create,
+                model="glm-4",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=kwargs.get('temperature', 0.7),
+                max_tokens=kwargs.get('max_tokens', 2000),
+                stream=True,
+                **_optional_params(kwargs),
+            )
+            
+            async for chunk in _iterate_sdk(stream):
+                delta = _stream_delta(chunk)
+                if delta:
+                    yield delta
+                
+        except (zhipuai.ZhipuAIError, KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Error streaming from GLM API: {str(e)}") from e
     
     async def generate_with_tools(self, messages: List[Dict], tools: List[Dict], **kwargs) -> Dict:
         """Generate a response with tool calling using GLM"""
@@ -62,90 +199,92 @@ class GLMModel(AIModel):
             prompt = self._convert_messages_to_prompt(messages)
             
             # Add tool information to prompt
-            tool_descriptions = []
-            for tool in tools:
-                tool_descriptions.append(f"- {tool['name']}: {tool['description']}")
-            
-            tool_prompt = f"""
-Available tools:
-{chr(10).join(tool_descriptions)}
-
-Please respond with your answer and indicate if you want to use any tools.
-"""
+            tool_prompt = _format_tool_prompt(tuple((tool['name'], tool['description']) for tool in tools))
             
             full_prompt = prompt + "\n\n" + tool_prompt
             
-            response = zhipuai.model_api.invoke(
+            response = await _call_sdk(
+                self.client.chat.completions.create,
                 model="glm-4",
-                prompt=full_prompt,
+                messages=[{"role": "user", "content": full_prompt}],
                 temperature=kwargs.get('temperature', 0.7),
                 max_tokens=kwargs.get('max_tokens', 2000),
             )
             
-            if response['code'] == 200:
-                content = response['data']['choices'][0]['message']['content']
-                return {
-                    'content': content,
-                    'tool_calls': self._extract_tool_calls(content, tools)
-                }
-            else:
-                raise Exception(f"GLM API error: {response['msg']}")
+            content = response.choices[0].message.content
+            return {
+                'content': content,
+                'tool_calls': self._extract_tool_calls(content, tools)
+            }
                 
-        except Exception as e:
-            raise Exception(f"Error calling GLM API with tools: {str(e)}")
+        except (zhipuai.ZhipuAIError, KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Error calling GLM API with tools: {str(e)}") from e
     
     def _convert_messages_to_prompt(self, messages: List[Dict]) -> str:
         """Convert LangChain messages to GLM prompt format"""
-        prompt_parts = []
-        
-        for message in messages:
-            role = message.get('role', 'user')
-            content = message.get('content', '')
-            
-            if role == 'system':
-                prompt_parts.append(f"System: {content}")
-            elif role == 'user':
-                prompt_parts.append(f"Human: {content}")
-            elif role == 'assistant':
-                prompt_parts.append(f"Assistant: {content}")
-        
-        return "\n\n".join(prompt_parts)
+        return _format_prompt(tuple((message.get('role', 'user'), message.get('content', '')) for message in messages))
     
     def _extract_tool_calls(self, content: str, tools: List[Dict]) -> List[Dict]:
         """Extract tool calls from GLM response"""
-        tool_calls = []
+        names = tuple(tool['name'] for tool in tools)
+        if not names or not content:
+            return []
         
         # Simple tool call extraction (can be enhanced)
-        for tool in tools:
-            if f"use {tool['name']}" in content.lower() or f"call {tool['name']}" in content.lower():
-                tool_calls.append({
-                    'name': tool['name'],
-                    'arguments': {}  # Would need more sophisticated parsing
-                })
-        
-        return tool_calls
+        found = {match.group(1).lower() for match in _tool_call_pattern(names).finditer(content)}
+        return [
+            {
+                'name': name,
+                'arguments': {}  # Would need more sophisticated parsing
+            }
+            for name in names if name.lower() in found
+        ]
 
 class GROQModel(AIModel):
     """GROQ model integration"""
+    __slots__ = ('client',)
     
     def __init__(self, api_key: str):
         super().__init__(api_key)
-        self.client = Groq(api_key=api_key)
+        self.client = Groq(api_key=api_key, http_client=_HTTP)
     
     async def generate_response(self, messages: List[Dict], **kwargs) -> str:
         """Generate a response using GROQ model"""
         try:
-            response = self.client.chat.completions.create(
+            response = await _call_sdk(
+                self.client.chat.completions.create,
                 model="llama3-8b-8192",  # or "mixtral-8x7b-32768"
                 messages=messages,
                 temperature=kwargs.get('temperature', 0.7),
                 max_tokens=kwargs.get('max_tokens', 2000),
+                **_optional_params(kwargs),
             )
             
             return response.choices[0].message.content
             
-        except Exception as e:
-            raise Exception(f"Error calling GROQ API: {str(e)}")
+        except (GroqError, KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Error calling GROQ API: {str(e)}") from e
+    
+    async def generate_response_stream(self, messages: List[Dict], **kwargs):
+        """Stream a response from the GROQ model as text deltas"""
+        try:
+            stream = await _call_sdk(
+                self.client.chat.completions.create,
+                model="llama3-8b-8192",
+                messages=messages,
+                temperature=kwargs.get('temperature', 0.7),
+                max_tokens=kwargs.get('max_tokens', 2000),
+                stream=True,
+                **_optional_params(kwargs),
+            )
+            
+            async for chunk in _iterate_sdk(stream):
+                delta = _stream_delta(chunk)
+                if delta:
+                    yield delta
+            
+        except (GroqError, KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Error streaming from GROQ API: {str(e)}") from e
     
     async def generate_with_tools(self, messages: List[Dict], tools: List[Dict], **kwargs) -> Dict:
         """Generate a response with tool calling using GROQ"""
@@ -162,7 +301,8 @@ class GROQModel(AIModel):
                     }
                 })
             
-            response = self.client.chat.completions.create(
+            response = await _call_sdk(
+                self.client.chat.completions.create,
                 model="llama3-8b-8192",
                 messages=messages,
                 tools=groq_tools,
@@ -186,52 +326,92 @@ class GROQModel(AIModel):
                 'tool_calls': tool_calls
             }
             
-        except Exception as e:
-            raise Exception(f"Error calling GROQ API with tools: {str(e)}")
+        except (GroqError, KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Error calling GROQ API with tools: {str(e)}") from e
+
+def _initialize_models() -> Dict[str, AIModel]:
+    """Initialize available AI models"""
+    models = {}
+    
+    # GLM Model
+    glm_key = os.getenv('GLM_API_KEY')
+    if glm_key:
+        models['glm'] = GLMModel(glm_key)
+    
+    # GROQ Model
+    groq_key = os.getenv('GROQ_API_KEY')
+    if groq_key:
+        models['groq'] = GROQModel(groq_key)
+    
+    return models
+
+# Models configured for this process, fixed at import time
+_MODELS: Final[Mapping[str, AIModel]] = MappingProxyType(_initialize_models())
+
+async def generate_response(messages: List[Dict], model_name: str = 'glm', **kwargs) -> str:
+    """Generate response using specified model"""
+    model = _MODELS.get(model_name)
+    if not model:
+        raise Exception(f"Model {model_name} not available")
+    
+    ttl = kwargs.pop('cache_ttl', _RESP_CACHE_TTL)
+    key = None
+    if ttl > 0:
+        key = _cache_key(messages, model_name, kwargs.get('temperature', 0.7), kwargs.get('max_tokens', 2000), _optional_params(kwargs))
+        cached = _cache_get(key, ttl)
+        if cached is not None:
+            return cached
+    
+    response = await model.generate_response(messages, **kwargs)
+    _cache_put(key, response)
+    return response
+
+async def generate_response_stream(messages: List[Dict], model_name: str = 'glm', **kwargs):
+    """Stream a response from the specified model as text deltas (never cached)"""
+    model = _MODELS.get(model_name)
+    if not model:
+        raise Exception(f"Model {model_name} not available")
+    
+    kwargs.pop('cache_ttl', None)
+    async for delta in model.generate_response_stream(messages, **kwargs):
+        yield delta
+
+async def generate_with_tools(messages: List[Dict], tools: List[Dict], 
+                              model_name: str = 'glm', **kwargs) -> Dict:
+    """Generate response with tools using specified model"""
+    model = _MODELS.get(model_name)
+    if not model:
+        raise Exception(f"Model {model_name} not available")
+    
+    ttl = kwargs.pop('cache_ttl', _RESP_CACHE_TTL)
+    key = None
+    if ttl > 0:
+        key = _cache_key(messages, model_name, kwargs.get('temperature', 0.7), kwargs.get('max_tokens', 2000), tools)
+        cached = _cache_get(key, ttl)
+        if cached is not None:
+            return cached
+    
+    response = await model.generate_with_tools(messages, tools, **kwargs)
+    _cache_put(key, response)
+    return response
 
 class ModelManager:
-    """Manages different AI models and provides unified interface"""
+    """Backward-compatible facade over the module-level model registry"""
+    
+    generate_response = staticmethod(generate_response)
+    generate_with_tools = staticmethod(generate_with_tools)
+    generate_response_stream = staticmethod(generate_response_stream)
     
     def __init__(self):
-        self.models = {}
-        self._initialize_models()
-    
-    def _initialize_models(self):
-        """Initialize available AI models"""
-        # GLM Model
-        glm_key = os.getenv('GLM_API_KEY')
-        if glm_key:
-            self.models['glm'] = GLMModel(glm_key)
-        
-        # GROQ Model
-        groq_key = os.getenv('GROQ_API_KEY')
-        if groq_key:
-            self.models['groq'] = GROQModel(groq_key)
+        self.models = _MODELS
     
     def get_model(self, model_name: str = 'glm') -> Optional[AIModel]:
         """Get a specific AI model"""
-        return self.models.get(model_name)
+        return _MODELS.get(model_name)
     
     def get_available_models(self) -> List[str]:
         """Get list of available models"""
-        return list(self.models.keys())
-    
-    async def generate_response(self, messages: List[Dict], model_name: str = 'glm', **kwargs) -> str:
-        """Generate response using specified model"""
-        model = self.get_model(model_name)
-        if not model:
-            raise Exception(f"Model {model_name} not available")
-        
-        return await model.generate_response(messages, **kwargs)
-    
-    async def generate_with_tools(self, messages: List[Dict], tools: List[Dict], 
-                                model_name: str = 'glm', **kwargs) -> Dict:
-        """Generate response with tools using specified model"""
-        model = self.get_model(model_name)
-        if not model:
-            raise Exception(f"Model {model_name} not available")
-        
-        return await model.generate_with_tools(messages, tools, **kwargs)
+        return list(_MODELS.keys())
 
 # Global model manager instance
 model_manager = ModelManager()
@@ -1,21 +1,55 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from flask_socketio import SocketIO, emit
+from quart import Quart, Response, g, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+from quart_cors import cors
+import socketio
+import msgspec
 import os
 from dotenv import load_dotenv
 import json
 from datetime import datetime, timedelta
+from typing import List, Optional
 import asyncio
-from threading import Thread
+import hashlib
+import inspect
+import logging
+import logging.handlers
+import queue
 import time
+from collections import OrderedDict, deque
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
 
 # Load environment variables
 load_dotenv()
 
+# Log records are queued and written by a listener thread, off the event loop
+log = logging.getLogger("omni")
+log.setLevel(logging.INFO)
+log.propagate = False
+_log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+log_listener.start()
+
 # Import our custom modules
 from omni_agent_simple import OmniAgent
 from intelligent_agent import IntelligentAgent
-from service_connectors import ServiceManager
+from service_connectors import ServiceManager, close_http_session
 from automation_engine import AutomationEngine
 from context_engine import ContextEngine
 from social_providers import (
@@ -27,92 +61,362 @@ from social_providers import (
     publish_to_email,
 )
 
-app = Flask(__name__)
-CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and parses request and response bodies with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = cors(Quart(__name__), allow_origin="*")
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Automations, context and the local cache live in process memory, so each
+# worker would fire every schedule itself and see only its own automations
+if int(os.getenv('WEB_CONCURRENCY', '1')) > 1:
+    raise RuntimeError("Run the backend as a single worker; automation state is not shared between processes")
+
+# Redis, when configured, carries sessions, cached data and Socket.IO events
+REDIS_URL = os.getenv('REDIS_URL')
+sio = socketio.AsyncServer(
+    async_mode='asgi',
+    cors_allowed_origins="*",
+    json=app.json,
+    client_manager=socketio.AsyncRedisManager(REDIS_URL) if redis and REDIS_URL else None
+)
+
+# ASGI entry point serving both the HTTP routes and Socket.IO
+asgi = socketio.ASGIApp(sio, app)
+
+# Request bodies, decoded and validated in a single pass
+class ConnectServiceIn(msgspec.Struct):
+    service_type: str
+    credentials: Optional[dict] = None
+
+class DisconnectServiceIn(msgspec.Struct):
+    service_type: str
+
+class ChatIn(msgspec.Struct):
+    message: str
+    session_id: str = 'default'
+    context: dict = {}
+
+class TaskIn(msgspec.Struct):
+    title: str
+    description: Optional[str] = None
+    priority: str = 'medium'
+    due_date: Optional[str] = None
+    service: str = 'auto'
+
+class MessageIn(msgspec.Struct):
+    message: str
+    recipient: str
+    channel: str = 'auto'
+
+class AutomationIn(msgspec.Struct):
+    name: str
+    trigger: dict
+    actions: List[dict]
+    conditions: list = []
+
+class SocialPublishIn(msgspec.Struct):
+    postId: Optional[str] = None
+    platforms: List[str] = []
+
+async def read_body(struct_type):
+    """Decode the JSON request body into struct_type"""
+    return msgspec.json.decode(await request.get_data() or b'{}', type=struct_type)
+
+@app.errorhandler(msgspec.DecodeError)
+async def invalid_body(error):
+    return jsonify({"success": False, "error": str(error)}), 400
+
+# Per-route latency histogram, exposed at /metrics for Prometheus to scrape
+if prometheus_client is not None:
+    # Registry owned by this module: uvicorn's reload child imports
+    # app.py twice (as __mp_main__ and as app), which the global one rejects
+    METRICS_REGISTRY = prometheus_client.CollectorRegistry()
+    prometheus_client.ProcessCollector(registry=METRICS_REGISTRY)
+    prometheus_client.PlatformCollector(registry=METRICS_REGISTRY)
+    prometheus_client.GCCollector(registry=METRICS_REGISTRY)
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        'omni_request_seconds', 'Request latency', ['route', 'method'], registry=METRICS_REGISTRY
+    )
+    
+    @app.before_request
+    async def start_request_timer():
+        g.request_start = time.perf_counter()
+    
+    @app.after_request
+    async def observe_request_latency(response):
+        start = getattr(g, 'request_start', None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            REQUEST_LATENCY.labels(route, request.method).observe(time.perf_counter() - start)
+        return response
+    
+    @app.route('/metrics', methods=['GET'])
+    async def metrics():
+        return Response(prometheus_client.generate_latest(METRICS_REGISTRY), content_type=prometheus_client.CONTENT_TYPE_LATEST)
+
+# PROFILE=1 profiles each request with pyinstrument and logs the report
+if os.getenv('PROFILE'):
+    import pyinstrument
+    
+    @app.before_request
+    async def start_profiler():
+        g.profiler = pyinstrument.Profiler(async_mode='enabled')
+        g.profiler.start()
+    
+    @app.after_request
+    async def stop_profiler(response):
+        profiler = getattr(g, 'profiler', None)
+        if profiler is not None:
+            profiler.stop()
+            log.info("Profile for %s %s\n%s", request.method, request.path, profiler.output_text())
+        return response
 
 # Initialize core components
 service_manager = ServiceManager()
 context_engine = ContextEngine()
-automation_engine = AutomationEngine(service_manager, context_engine)
+automation_engine = AutomationEngine(service_manager, context_engine, autostart=False)
 omni_agent = OmniAgent(service_manager, context_engine, automation_engine)
 intelligent_agent = IntelligentAgent(service_manager, context_engine, automation_engine)
 
-# Global state for real-time updates
-active_sessions = {}
+def ttl_cache(ttl):
+    """Reuse a no-argument function's result for ttl seconds"""
+    def decorator(fn):
+        cache = {'expires': 0.0, 'value': None}
+        
+        def wrapper():
+            now = time.monotonic()
+            if now >= cache['expires']:
+                cache['value'] = fn()
+                cache['expires'] = now + ttl
+            return cache['value']
+        
+        def invalidate():
+            cache['expires'] = 0.0
+        
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
+
+# Context snapshot shared by the requests arriving within a two second window
+get_context_cached = ttl_cache(2.0)(context_engine.get_context)
+
+# Global state for real-time updates, least recently active session first
+active_sessions = OrderedDict()
+SESSION_MAX = 1024
+MSGS_MAX = 200
+
+# Session history lives in Redis when REDIS_URL is set so it survives restarts
+redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True) if redis and REDIS_URL else None
+SESSION_TTL = 3600
+
+async def start_session(session_id, context, now):
+    """Start a fresh session, dropping any earlier history"""
+    if redis_client is None:
+        active_sessions[session_id] = {
+            'messages': deque(maxlen=MSGS_MAX),
+            'context': context,
+            'last_activity': now
+        }
+        active_sessions.move_to_end(session_id)
+        if len(active_sessions) > SESSION_MAX:
+            active_sessions.popitem(last=False)
+        return
+    
+    key = f"sess:{session_id}"
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.delete(f"{key}:msgs")
+        pipe.set(f"{key}:ctx", json.dumps(context, default=str), ex=SESSION_TTL)
+        pipe.set(f"{key}:last", now.timestamp(), ex=SESSION_TTL)
+        await pipe.execute()
+
+async def store_session_message(session_id, context, entry, now):
+    """Append one exchange to the session history, creating the session if needed"""
+    if redis_client is None:
+        session = active_sessions.get(session_id)
+        if session is None:
+            session = active_sessions[session_id] = {
+                'messages': deque(maxlen=MSGS_MAX),
+                'context': context,
+                'last_activity': now
+            }
+            if len(active_sessions) > SESSION_MAX:
+                active_sessions.popitem(last=False)
+        else:
+            active_sessions.move_to_end(session_id)
+        session['messages'].append(entry)
+        session['last_activity'] = now
+        return
+    
+    key = f"sess:{session_id}"
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.rpush(f"{key}:msgs", json.dumps(entry, default=str))
+        pipe.ltrim(f"{key}:msgs", -MSGS_MAX, -1)
+        pipe.expire(f"{key}:msgs", SESSION_TTL)
+        pipe.set(f"{key}:ctx", json.dumps(context, default=str), ex=SESSION_TTL, nx=True)
+        pipe.set(f"{key}:last", now.timestamp(), ex=SESSION_TTL)
+        await pipe.execute()
+
+def evict_idle_sessions(now):
+    """Drop in-process sessions idle for longer than SESSION_TTL"""
+    cutoff = now - timedelta(seconds=SESSION_TTL)
+    while active_sessions:
+        session_id, session = next(iter(active_sessions.items()))
+        if session['last_activity'] >= cutoff:
+            break
+        del active_sessions[session_id]
+
+# Read-through cache for polled GET data, in Redis when available
+CACHE_TTL = {
+    'tasks': 5,
+    'messages': 5,
+    'calendar': 5,
+    'automations': 5,
+    'insights': 60,
+    'analytics': 60,
+    'life_metrics': 300,
+}
+local_cache = {}
+
+async def cached(name, compute):
+    """Get a cached value, calling compute() (sync or async) on a miss"""
+    key = f"cache:{name}"
+    if redis_client is not None:
+        hit = await redis_client.get(key)
+        if hit is not None:
+            return app.json.loads(hit)
+    else:
+        hit = local_cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+    
+    value = compute()
+    if inspect.isawaitable(value):
+        value = await value
+    
+    if redis_client is not None:
+        # Encoded like a response body and returned decoded, so a miss hands
+        # back exactly what later hits will
+        encoded = app.json.dumps(value)
+        await redis_client.set(key, encoded, ex=CACHE_TTL[name])
+        return app.json.loads(encoded)
+    
+    local_cache[key] = (time.monotonic() + CACHE_TTL[name], value)
+    return value
+
+async def invalidate_cached(*names):
+    """Drop cached values after a write that changes them"""
+    keys = [f"cache:{name}" for name in names]
+    if redis_client is not None:
+        await redis_client.delete(*keys)
+    else:
+        for key in keys:
+            local_cache.pop(key, None)
+
+# Agent calls in flight, so identical concurrent requests share one result
+inflight = {}
+
+async def coalesce(key, start):
+    """Await the call running under key, starting it with start() if there is none"""
+    future = inflight.get(key)
+    if future is None:
+        future = inflight[key] = asyncio.ensure_future(start())
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shielded so one client going away doesn't cancel the call for the others
+    return await asyncio.shield(future)
+
+def inflight_key(route, session_id, message):
+    return (route, session_id, hashlib.blake2b(message.encode(), digest_size=8).digest())
+
+async def conditional_jsonify(payload):
+    """JSON response tagged with a content hash, or an empty 304 if the client already has it"""
+    response = jsonify(payload)
+    etag = hashlib.blake2b(await response.get_data(), digest_size=16).hexdigest()
+    if request.if_none_match.contains(etag):
+        return "", 304, {"ETag": f'"{etag}"'}
+    response.set_etag(etag)
+    return response
 
 @app.route('/api/health', methods=['GET'])
-def health_check():
+async def health_check():
     return jsonify({"status": "healthy", "timestamp": datetime.now().isoformat()})
 
 @app.route('/api/connect-service', methods=['POST'])
-def connect_service():
+async def connect_service():
     """Connect a new service to Omni"""
-    data = request.get_json()
-    service_type = data.get('service_type')
-    credentials = data.get('credentials')
+    data = await read_body(ConnectServiceIn)
+    service_type = data.service_type
+    credentials = data.credentials
     
     try:
-        result = service_manager.connect_service(service_type, credentials)
+        result = await service_manager.connect_service(service_type, credentials)
+        await invalidate_cached('tasks', 'messages', 'calendar')
         return jsonify({"success": True, "message": f"Connected to {service_type}", "data": result})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
 @app.route('/api/disconnect-service', methods=['POST'])
-def disconnect_service():
+async def disconnect_service():
     """Disconnect a service from Omni"""
-    data = request.get_json()
-    service_type = data.get('service_type')
+    data = await read_body(DisconnectServiceIn)
+    service_type = data.service_type
     
     try:
-        service_manager.disconnect_service(service_type)
+        await service_manager.disconnect_service(service_type)
+        await invalidate_cached('tasks', 'messages', 'calendar')
         return jsonify({"success": True, "message": f"Disconnected from {service_type}"})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
 @app.route('/api/chat', methods=['POST'])
-def chat_with_omni():
+async def chat_with_omni():
     """Main chat endpoint for interacting with Omni"""
-    data = request.get_json()
-    message = data.get('message')
-    session_id = data.get('session_id', 'default')
-    context = data.get('context', {})
+    data = await read_body(ChatIn)
+    message = data.message
+    session_id = data.session_id
     
     try:
         # Get current context
-        current_context = context_engine.get_context()
+        current_context = get_context_cached()
         
         # Process the message through Omni agent
-        response = asyncio.run(omni_agent.process_message(message, current_context, session_id))
+        response = await coalesce(
+            inflight_key('chat', session_id, message),
+            lambda: omni_agent.process_message(message, current_context, session_id)
+        )
+        reply = response['response']
+        actions = response.get('actions_taken') or []
+        suggestions = response.get('suggestions') or []
         
         # Store session data
-        if session_id not in active_sessions:
-            active_sessions[session_id] = {
-                'messages': [],
-                'context': current_context,
-                'last_activity': datetime.now()
-            }
-        
-        active_sessions[session_id]['messages'].append({
+        now = datetime.now()
+        await store_session_message(session_id, current_context, {
             'user': message,
-            'omni': response['response'],
-            'timestamp': datetime.now().isoformat(),
-            'actions_taken': response.get('actions_taken', [])
-        })
-        active_sessions[session_id]['last_activity'] = datetime.now()
+            'omni': reply,
+            'timestamp': now.isoformat(),
+            'actions_taken': actions
+        }, now)
         
         # Emit real-time updates if any actions were taken
-        if response.get('actions_taken'):
-            socketio.emit('actions_completed', {
+        if actions:
+            await invalidate_cached('tasks', 'messages', 'calendar', 'automations')
+            await sio.emit('actions_completed', {
                 'session_id': session_id,
-                'actions': response['actions_taken']
-            })
+                'actions': actions
+            }, to=session_id)
         
         return jsonify({
             "success": True,
-            "response": response['response'],
-            "actions_taken": response.get('actions_taken', []),
-            "suggestions": response.get('suggestions', []),
+            "response": reply,
+            "actions_taken": actions,
+            "suggestions": suggestions,
             "context": current_context
         })
         
@@ -120,53 +424,54 @@ def chat_with_omni():
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/intelligent-chat', methods=['POST'])
-def intelligent_chat():
+async def intelligent_chat():
     """Intelligent chat endpoint that understands natural language and executes actions"""
-    data = request.get_json()
-    message = data.get('message')
-    session_id = data.get('session_id', 'default')
-    context = data.get('context', {})
+    data = await read_body(ChatIn)
+    message = data.message
+    session_id = data.session_id
     
     try:
         # Get current context
-        current_context = context_engine.get_context()
+        current_context = get_context_cached()
         
         # Process message with intelligent agent
-        response = asyncio.run(intelligent_agent.process_natural_input(message, current_context, session_id))
+        response = await coalesce(
+            inflight_key('intelligent-chat', session_id, message),
+            lambda: intelligent_agent.process_natural_input(message, current_context, session_id)
+        )
+        reply = response['response']
+        intent = response.get('intent') or {}
+        entities = response.get('entities') or {}
+        actions = response.get('actions_taken') or []
+        suggestions = response.get('suggestions') or []
         
         # Store session data
-        if session_id not in active_sessions:
-            active_sessions[session_id] = {
-                'messages': [],
-                'context': current_context,
-                'last_activity': datetime.now()
-            }
-        
-        active_sessions[session_id]['messages'].append({
+        now = datetime.now()
+        await store_session_message(session_id, current_context, {
             'user': message,
-            'omni': response['response'],
-            'timestamp': datetime.now().isoformat(),
-            'intent': response.get('intent', {}),
-            'entities': response.get('entities', {}),
-            'actions_taken': response.get('actions_taken', [])
-        })
-        active_sessions[session_id]['last_activity'] = datetime.now()
+            'omni': reply,
+            'timestamp': now.isoformat(),
+            'intent': intent,
+            'entities': entities,
+            'actions_taken': actions
+        }, now)
         
         # Emit real-time updates if any actions were taken
-        if response.get('actions_taken'):
-            socketio.emit('intelligent_actions_completed', {
+        if actions:
+            await invalidate_cached('tasks', 'messages', 'calendar', 'automations')
+            await sio.emit('intelligent_actions_completed', {
                 'session_id': session_id,
-                'intent': response.get('intent', {}),
-                'actions': response['actions_taken']
-            })
+                'intent': intent,
+                'actions': actions
+            }, to=session_id)
         
         return jsonify({
             "success": True,
-            "response": response['response'],
-            "intent": response.get('intent', {}),
-            "entities": response.get('entities', {}),
-            "actions_taken": response.get('actions_taken', []),
-            "suggestions": response.get('suggestions', []),
+            "response": reply,
+            "intent": intent,
+            "entities": entities,
+            "actions_taken": actions,
+            "suggestions": suggestions,
             "context": current_context
         })
         
@@ -174,193 +479,240 @@ def intelligent_chat():
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/dashboard', methods=['GET'])
-def get_dashboard_data():
+async def get_dashboard_data():
     """Get comprehensive dashboard data"""
     try:
+        # Fetch every section concurrently so latency is the slowest source, not the sum
+        tasks, messages, calendar, life_metrics, automations, insights = await asyncio.gather(
+            cached('tasks', service_manager.get_all_tasks),
+            cached('messages', service_manager.get_all_messages),
+            cached('calendar', service_manager.get_calendar_events),
+            cached('life_metrics', context_engine.get_life_metrics),
+            cached('automations', automation_engine.get_active_automations),
+            cached('insights', context_engine.get_insights)
+        )
         dashboard_data = {
-            'tasks': service_manager.get_all_tasks(),
-            'messages': service_manager.get_all_messages(),
-            'calendar': service_manager.get_calendar_events(),
-            'life_metrics': context_engine.get_life_metrics(),
-            'automations': automation_engine.get_active_automations(),
-            'insights': context_engine.get_insights()
+            'tasks': tasks,
+            'messages': messages,
+            'calendar': calendar,
+            'life_metrics': life_metrics,
+            'automations': automations,
+            'insights': insights
         }
-        return jsonify({"success": True, "data": dashboard_data})
+        return await conditional_jsonify({"success": True, "data": dashboard_data})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/tasks', methods=['GET'])
-def get_tasks():
+async def get_tasks():
     """Get all tasks from connected services"""
     try:
-        tasks = service_manager.get_all_tasks()
-        return jsonify({"success": True, "tasks": tasks})
+        tasks = await cached('tasks', service_manager.get_all_tasks)
+        return await conditional_jsonify({"success": True, "tasks": tasks})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/tasks', methods=['POST'])
-def create_task():
+async def create_task():
     """Create a new task"""
-    data = request.get_json()
+    data = await read_body(TaskIn)
     try:
-        task = service_manager.create_task(
-            title=data.get('title'),
-            description=data.get('description'),
-            priority=data.get('priority', 'medium'),
-            due_date=data.get('due_date'),
-            service=data.get('service', 'auto')
+        task = await service_manager.create_task(
+            title=data.title,
+            description=data.description,
+            priority=data.priority,
+            due_date=data.due_date,
+            service=data.service
         )
+        await invalidate_cached('tasks')
         return jsonify({"success": True, "task": task})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/messages', methods=['GET'])
-def get_messages():
+async def get_messages():
     """Get messages from all communication channels"""
     try:
-        messages = service_manager.get_all_messages()
-        return jsonify({"success": True, "messages": messages})
+        messages = await cached('messages', service_manager.get_all_messages)
+        return await conditional_jsonify({"success": True, "messages": messages})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/send-message', methods=['POST'])
-def send_message():
+async def send_message():
     """Send a message via the best channel"""
-    data = request.get_json()
+    data = await read_body(MessageIn)
     try:
-        result = service_manager.send_message(
-            message=data.get('message'),
-            recipient=data.get('recipient'),
-            channel=data.get('channel', 'auto')
+        result = await service_manager.send_message(
+            message=data.message,
+            recipient=data.recipient,
+            channel=data.channel
         )
+        await invalidate_cached('messages')
         return jsonify({"success": True, "result": result})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/automations', methods=['GET'])
-def get_automations():
+async def get_automations():
     """Get all active automations"""
     try:
-        automations = automation_engine.get_active_automations()
+        automations = await cached('automations', automation_engine.get_active_automations)
         return jsonify({"success": True, "automations": automations})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/automations', methods=['POST'])
-def create_automation():
+async def create_automation():
     """Create a new automation"""
-    data = request.get_json()
+    data = await read_body(AutomationIn)
     try:
         automation = automation_engine.create_automation(
-            name=data.get('name'),
-            trigger=data.get('trigger'),
-            actions=data.get('actions'),
-            conditions=data.get('conditions', [])
+            name=data.name,
+            trigger=data.trigger,
+            actions=data.actions,
+            conditions=data.conditions
         )
+        await invalidate_cached('automations')
         return jsonify({"success": True, "automation": automation})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/insights', methods=['GET'])
-def get_insights():
+async def get_insights():
     """Get AI-powered insights about user's digital life"""
     try:
-        insights = context_engine.get_insights()
+        insights = await cached('insights', context_engine.get_insights)
         return jsonify({"success": True, "insights": insights})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/context', methods=['GET'])
-def get_context():
+async def get_context():
     """Get current user context"""
     try:
-        context = context_engine.get_context()
-        return jsonify({"success": True, "context": context})
+        # The engine keeps the serialized context per version, so splice it in as-is
+        body = b'{"success":true,"context":' + context_engine.get_context_json() + b'}'
+        return Response(body, content_type='application/json')
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/analytics', methods=['GET'])
-def get_analytics():
+async def get_analytics():
     """Get productivity and life analytics"""
     try:
-        analytics = context_engine.get_analytics()
+        analytics = await cached('analytics', context_engine.get_analytics)
         return jsonify({"success": True, "analytics": analytics})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+# Provider for each supported social platform
+PUBLISHERS = {
+    'twitter': lambda content: publish_to_twitter(content, {}),
+    'linkedin': lambda content: publish_to_linkedin(content, {}),
+    'instagram': lambda content: publish_to_instagram(content, {}),
+    'facebook': lambda content: publish_to_facebook(content, {}),
+    'slack': lambda content: publish_to_slack(content, {}),
+    'email': lambda content: publish_to_email("Post", content, {}),
+}
+UNSUPPORTED_PLATFORM = {"success": False, "error": "Unsupported platform"}
+
 # Social publishing proxy (uses env credentials server-side)
 @app.route('/api/social/publish', methods=['POST'])
-def social_publish():
-    data = request.get_json() or {}
-    post_id = data.get('postId')
-    platforms = data.get('platforms', [])
+async def social_publish():
+    data = await read_body(SocialPublishIn)
+    post_id = data.postId
+    platforms = data.platforms
     # TODO: Load user tokens from DB by post_id or session and pass to providers
     content = ""  # Load post content from DB if needed
+    supported = [p for p in platforms if p in PUBLISHERS]
+    
+    # Providers are blocking calls, so publish to every platform at once from worker threads
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(PUBLISHERS[p], content) for p in supported),
+        return_exceptions=True
+    )
+    published = dict(zip(supported, outcomes))
     results = {}
     for p in platforms:
-        if p == 'twitter':
-            results[p] = publish_to_twitter(content, {})
-        elif p == 'linkedin':
-            results[p] = publish_to_linkedin(content, {})
-        elif p == 'instagram':
-            results[p] = publish_to_instagram(content, {})
-        elif p == 'facebook':
-            results[p] = publish_to_facebook(content, {})
-        elif p == 'slack':
-            results[p] = publish_to_slack(content, {})
-        elif p == 'email':
-            results[p] = publish_to_email("Post", content, {})
-        else:
-            results[p] = {"success": False, "error": "Unsupported platform"}
+        outcome = published.get(p, UNSUPPORTED_PLATFORM)
+        results[p] = {"success": False, "error": str(outcome)} if isinstance(outcome, Exception) else outcome
     return jsonify({"success": True, "results": results})
 
 # WebSocket events
-@socketio.on('connect')
-def handle_connect():
-    print('Client connected')
-    emit('connected', {'message': 'Connected to Omni'})
+@sio.on('connect')
+async def handle_connect(sid, environ):
+    log.info('Client connected')
+    await sio.emit('connected', {'message': 'Connected to Omni'}, to=sid)
 
-@socketio.on('disconnect')
-def handle_disconnect():
-    print('Client disconnected')
+@sio.on('disconnect')
+async def handle_disconnect(sid):
+    log.info('Client disconnected')
 
-@socketio.on('join_session')
-def handle_join_session(data):
+@sio.on('join_session')
+async def handle_join_session(sid, data):
     session_id = data.get('session_id', 'default')
-    active_sessions[session_id] = {
-        'messages': [],
-        'context': context_engine.get_context(),
-        'last_activity': datetime.now()
-    }
-    emit('session_joined', {'session_id': session_id})
+    await start_session(session_id, get_context_cached(), datetime.now())
+    await sio.enter_room(sid, session_id)
+    await sio.emit('session_joined', {'session_id': session_id}, to=sid)
+
+# Clients per broadcast emit before yielding back to the event loop
+BROADCAST_BATCH = 50
+
+async def broadcast(event, data):
+    """Emit to every connected client in batches so large fan-outs don't stall the loop"""
+    sids = [sid for sid, _ in sio.manager.get_participants('/', None)]
+    for i in range(0, len(sids), BROADCAST_BATCH):
+        await sio.emit(event, data, to=sids[i:i + BROADCAST_BATCH])
+        await asyncio.sleep(0)
 
 # Background task for real-time updates
-def background_updates():
+async def background_updates():
     """Send periodic updates to connected clients"""
     while True:
         try:
-            # Check for new messages, tasks, etc.
-            updates = service_manager.check_for_updates()
-            if updates:
-                socketio.emit('updates', updates)
+            evict_idle_sessions(datetime.now())
             
-            # Update context periodically
-            context_engine.update_context()
+            # Nothing to push while no client is connected
+            if next(sio.manager.get_participants('/', None), None) is not None:
+                # Check for new messages, tasks, etc.
+                updates = service_manager.check_for_updates()
+                if updates:
+                    await broadcast('updates', updates)
+                
+                # Update context periodically
+                context_engine.update_context()
+                get_context_cached.invalidate()
             
-            time.sleep(30)  # Check every 30 seconds
-        except Exception as e:
-            print(f"Error in background updates: {e}")
-            time.sleep(60)
+            await asyncio.sleep(30)  # Check every 30 seconds
+        except Exception:
+            log.exception("Error in background updates")
+            await asyncio.sleep(60)
 
-# Start background thread
-update_thread = Thread(target=background_updates, daemon=True)
-update_thread.start()
+@app.before_serving
+async def start_background_updates():
+    app.background_updates = asyncio.create_task(background_updates())
+    automation_engine.start_worker()
+
+@app.after_serving
+async def stop_background_updates():
+    app.background_updates.cancel()
+    automation_engine.stop_worker()
+    await close_http_session()
+    log_listener.stop()
 
 if __name__ == '__main__':
+    import uvicorn
+    
     print("🚀 Starting Omni Universal Assistant...")
     print("📱 Frontend: http://localhost:3000")
     print("🔧 Backend: http://localhost:5000")
     print("🤖 AI Agent: Ready")
     print("🔌 Service Connectors: Initializing...")
     
-    socketio.run(app, debug=True, host='0.0.0.0', port=5000)
+    if os.getenv('DEV'):
+        # Single process that reloads on code changes
+        uvicorn.run('app:asgi', host='0.0.0.0', port=5000, reload=True)
+    else:
+        # One worker: automation state is per process (see WEB_CONCURRENCY above)
+        uvicorn.run(asgi, host='0.0.0.0', port=5000)
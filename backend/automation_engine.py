@@ -6,13 +6,23 @@ Creates intelligent automations that connect different services and reduce manua
 import os
 import json
 import asyncio
+import heapq
+import inspect
+import itertools
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Iterator, Tuple
+from collections import deque
+from dataclasses import dataclass, field, replace
 from enum import Enum
-import schedule
+from functools import lru_cache, partial
+from string import Formatter
 import time
-from threading import Thread
+from threading import Lock, Thread
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 class TriggerType(Enum):
     TIME_BASED = "time_based"
@@ -31,14 +41,14 @@ class ActionType(Enum):
     LOG_ACTIVITY = "log_activity"
     CUSTOM_SCRIPT = "custom_script"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AutomationTrigger:
     """Defines when an automation should be triggered"""
     type: TriggerType
     condition: str  # Cron expression, event name, or condition
     parameters: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AutomationAction:
     """Defines what action to take when triggered"""
     type: ActionType
@@ -46,7 +56,7 @@ class AutomationAction:
     service: str
     delay_seconds: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Automation:
     """Complete automation definition"""
     id: str
@@ -55,291 +65,516 @@ class Automation:
     trigger: AutomationTrigger
     actions: List[AutomationAction]
     conditions: List[str]  # Additional conditions that must be met
-    enabled: bool
-    created_at: datetime
-    last_run: Optional[datetime]
-    run_count: int
-    success_rate: float
+    created_at: int  # time.time_ns()
 
-class AutomationEngine:
-    """
-    Advanced automation engine that creates intelligent workflows
-    between different services and reduces manual work
-    """
+# Number of recent runs the success rate is computed over
+_OUTCOME_WINDOW = 50
+
+@dataclass(slots=True)
+class AutomationState:
+    """Mutable run state of an automation, kept apart from its definition"""
+    # Fields are only ever replaced wholesale or advanced by a C-level call,
+    # so readers on other threads never see a half-applied update
+    last_run: Optional[Tuple[int, bool]] = None  # (time.time_ns(), succeeded)
+    last_run_iso: Optional[str] = None  # formatted once per run, not per listing
+    run_count: int = 0
+    runs: Iterator[int] = field(default_factory=itertools.count)
+    outcomes: deque = field(default_factory=lambda: deque(maxlen=_OUTCOME_WINDOW))
     
-    def __init__(self, service_manager, context_engine):
-        self.service_manager = service_manager
-        self.context_engine = context_engine
-        self.automations = {}
-        self.running = False
-        self.worker_thread = None
+    @property
+    def success_rate(self) -> float:
+        outcomes = tuple(self.outcomes)
+        return sum(outcomes) / len(outcomes) if outcomes else 1.0
+
+class _SafeDict(dict):
+    """Format mapping that leaves unknown placeholders in place"""
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+class _Template:
+    """Action parameter string with {name} placeholders, parsed once at creation"""
+    __slots__ = ('text',)
+    
+    def __init__(self, text: str):
+        self.text = text
+    
+    def render(self, context: Dict) -> str:
+        return self.text.format_map(_SafeDict(context))
+
+def _compile_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Swap parameter strings holding named placeholders for templates"""
+    compiled = {}
+    for key, value in parameters.items():
+        if isinstance(value, str) and "{" in value:
+            try:
+                fields = [field for _, field, _, _ in Formatter().parse(value) if field is not None]
+            except ValueError:
+                fields = []
+            if fields and all(field.isidentifier() for field in fields):
+                value = _Template(value)
+        compiled[key] = value
+    return compiled
+
+def _daily_at(hour: int, minute: int) -> Callable[[float], float]:
+    """Next-fire function for a fixed time of day"""
+    def next_fire(now: float) -> float:
+        current = datetime.fromtimestamp(now)
+        fire = current.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if fire <= current:
+            fire += timedelta(days=1)
+        return fire.timestamp()
+    return next_fire
+
+def _every(seconds: int) -> Callable[[float], float]:
+    """Next-fire function for a fixed interval"""
+    return lambda now: now + seconds
+
+# Cron field bounds: minute, hour, day of month, month, day of week
+_CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+@lru_cache(maxsize=1024)
+def _parse_cron(cron_expression: str) -> Optional[tuple]:
+    """Parse a five-field cron expression into one bitmask per field"""
+    fields = cron_expression.split()
+    if len(fields) != 5:
+        return None
+    
+    masks = []
+    for field, (low, high) in zip(fields, _CRON_FIELDS):
+        mask = 0
+        for part in field.split(','):
+            base, _, step = part.partition('/')
+            try:
+                step = int(step) if step else 1
+                if base == '*':
+                    start, end = low, high
+                elif '-' in base:
+                    start, end = map(int, base.split('-', 1))
+                else:
+                    start = int(base)
+                    end = high if step > 1 else start
+            except ValueError:
+                return None
+            if step < 1 or not low <= start <= end <= high:
+                return None
+            for value in range(start, end + 1, step):
+                mask |= 1 << value
+        masks.append(mask)
+    
+    # Sunday may be written as 0 or 7
+    if masks[4] & (1 << 7):
+        masks[4] = (masks[4] | 1) & 0x7F
+    # Day of month and day of week are OR-ed when both are restricted
+    day_or = fields[2] != '*' and fields[4] != '*'
+    return (*masks, day_or)
+
+def _next_fire_kernel(year, month, day, hour, minute, weekday,
+                      m_mask, h_mask, d_mask, mo_mask, dw_mask, day_or):
+    """Find the first minute after the given one matching the cron masks
+
+    weekday counts from Sunday = 0; the result is packed as YYYYMMDDHHMM,
+    or -1 when nothing matches within five years.
+    """
+    minute += 1
+    for _ in range(5 * 366):
+        if month == 2:
+            days_in_month = 29 if (year % 4 == 0 and year % 100 != 0) or year % 400 == 0 else 28
+        elif month == 4 or month == 6 or month == 9 or month == 11:
+            days_in_month = 30
+        else:
+            days_in_month = 31
         
-        # Pre-built automation templates
-        self.templates = self._initialize_templates()
+        if (mo_mask >> month) & 1:
+            dom_ok = (d_mask >> day) & 1
+            dow_ok = (dw_mask >> weekday) & 1
+            if (dom_ok or dow_ok) if day_or else (dom_ok and dow_ok):
+                while hour < 24:
+                    if (h_mask >> hour) & 1:
+                        while minute < 60:
+                            if (m_mask >> minute) & 1:
+                                return (((year * 100 + month) * 100 + day) * 100 + hour) * 100 + minute
+                            minute += 1
+                    hour += 1
+                    minute = 0
         
-        # Start the automation worker
-        self.start_worker()
+        hour = 0
+        minute = 0
+        weekday = (weekday + 1) % 7
+        day += 1
+        if day > days_in_month:
+            day = 1
+            month += 1
+            if month > 12:
+                month = 1
+                year += 1
+    return -1
+
+if njit is not None:
+    _next_fire_kernel = njit(cache=True)(_next_fire_kernel)
+
+def _cron_next_fire(cron_expression: str, now: float) -> Optional[float]:
+    """Get the next fire timestamp of an arbitrary cron expression"""
+    parsed = _parse_cron(cron_expression)
+    if parsed is None:
+        return None
     
-    def _initialize_templates(self) -> Dict[str, Dict]:
-        """Initialize pre-built automation templates"""
-        return {
-            "morning_routine": {
-                "name": "Morning Routine",
-                "description": "Automated morning routine with task planning and motivation",
-                "trigger": {
-                    "type": "time_based",
-                    "condition": "0 8 * * *",  # 8 AM daily
-                    "parameters": {}
+    current = datetime.fromtimestamp(now)
+    packed = _next_fire_kernel(
+        current.year, current.month, current.day, current.hour, current.minute,
+        (current.weekday() + 1) % 7, *parsed
+    )
+    if packed < 0:
+        return None
+    packed, minute = divmod(packed, 100)
+    packed, hour = divmod(packed, 100)
+    packed, day = divmod(packed, 100)
+    year, month = divmod(packed, 100)
+    return datetime(year, month, day, hour, minute).timestamp()
+
+# Cron expressions with a direct next-fire equivalent
+_CRON_NEXT_FIRE = {
+    "0 8 * * *": _daily_at(8, 0),  # 8 AM daily
+    "0 18 * * *": _daily_at(18, 0),  # 6 PM daily
+    "0 */2 * * *": _every(2 * 3600),  # Every 2 hours
+    "15 * * * *": _every(15 * 60),  # Every 15 minutes
+}
+
+# Pre-built automation templates
+_TEMPLATE_SPECS = {
+    "morning_routine": {
+        "name": "Morning Routine",
+        "description": "Automated morning routine with task planning and motivation",
+        "trigger": {
+            "type": "time_based",
+            "condition": "0 8 * * *",  # 8 AM daily
+            "parameters": {}
+        },
+        "actions": [
+            {
+                "type": "create_task",
+                "parameters": {
+                    "title": "Plan your day",
+                    "description": "Review goals and prioritize tasks",
+                    "priority": "high"
                 },
-                "actions": [
-                    {
-                        "type": "create_task",
-                        "parameters": {
-                            "title": "Plan your day",
-                            "description": "Review goals and prioritize tasks",
-                            "priority": "high"
-                        },
-                        "service": "auto",
-                        "delay_seconds": 0
-                    },
-                    {
-                        "type": "send_message",
-                        "parameters": {
-                            "message": "Good morning! Here's your daily plan and motivation quote.",
-                            "recipient": "self"
-                        },
-                        "service": "slack",
-                        "delay_seconds": 30
-                    }
-                ],
-                "conditions": ["work_mode"]
+                "service": "auto",
+                "delay_seconds": 0
             },
-            "task_completion_celebration": {
-                "name": "Task Completion Celebration",
-                "description": "Celebrates completed tasks and suggests next steps",
-                "trigger": {
-                    "type": "event_based",
-                    "condition": "task_completed",
-                    "parameters": {}
+            {
+                "type": "send_message",
+                "parameters": {
+                    "message": "Good morning! Here's your daily plan and motivation quote.",
+                    "recipient": "self"
+                },
+                "service": "slack",
+                "delay_seconds": 30
+            }
+        ],
+        "conditions": ["work_mode"]
+    },
+    "task_completion_celebration": {
+        "name": "Task Completion Celebration",
+        "description": "Celebrates completed tasks and suggests next steps",
+        "trigger": {
+            "type": "event_based",
+            "condition": "task_completed",
+            "parameters": {}
+        },
+        "actions": [
+            {
+                "type": "send_message",
+                "parameters": {
+                    "message": "🎉 Great job completing that task! What's next?",
+                    "recipient": "self"
                 },
-                "actions": [
-                    {
-                        "type": "send_message",
-                        "parameters": {
-                            "message": "🎉 Great job completing that task! What's next?",
-                            "recipient": "self"
-                        },
-                        "service": "slack",
-                        "delay_seconds": 0
-                    },
-                    {
-                        "type": "play_music",
-                        "parameters": {
-                            "playlist": "celebration",
-                            "duration": 30
-                        },
-                        "service": "spotify",
-                        "delay_seconds": 5
-                    }
-                ],
-                "conditions": []
+                "service": "slack",
+                "delay_seconds": 0
             },
-            "focus_time_automation": {
-                "name": "Focus Time Automation",
-                "description": "Creates optimal focus environment when starting deep work",
-                "trigger": {
-                    "type": "manual",
-                    "condition": "start_focus",
-                    "parameters": {}
+            {
+                "type": "play_music",
+                "parameters": {
+                    "playlist": "celebration",
+                    "duration": 30
+                },
+                "service": "spotify",
+                "delay_seconds": 5
+            }
+        ],
+        "conditions": []
+    },
+    "focus_time_automation": {
+        "name": "Focus Time Automation",
+        "description": "Creates optimal focus environment when starting deep work",
+        "trigger": {
+            "type": "manual",
+            "condition": "start_focus",
+            "parameters": {}
+        },
+        "actions": [
+            {
+                "type": "play_music",
+                "parameters": {
+                    "playlist": "focus",
+                    "duration": 0  # Play indefinitely
                 },
-                "actions": [
-                    {
-                        "type": "play_music",
-                        "parameters": {
-                            "playlist": "focus",
-                            "duration": 0  # Play indefinitely
-                        },
-                        "service": "spotify",
-                        "delay_seconds": 0
-                    },
-                    {
-                        "type": "send_message",
-                        "parameters": {
-                            "message": "🔇 Focus mode activated. I'll minimize distractions.",
-                            "recipient": "self"
-                        },
-                        "service": "slack",
-                        "delay_seconds": 0
-                    },
-                    {
-                        "type": "set_reminder",
-                        "parameters": {
-                            "message": "Time for a break!",
-                            "delay_minutes": 25
-                        },
-                        "service": "system",
-                        "delay_seconds": 0
-                    }
-                ],
-                "conditions": []
+                "service": "spotify",
+                "delay_seconds": 0
             },
-            "meeting_preparation": {
-                "name": "Meeting Preparation",
-                "description": "Prepares for upcoming meetings with relevant information",
-                "trigger": {
-                    "type": "time_based",
-                    "condition": "15 * * * *",  # Every 15 minutes
-                    "parameters": {}
+            {
+                "type": "send_message",
+                "parameters": {
+                    "message": "🔇 Focus mode activated. I'll minimize distractions.",
+                    "recipient": "self"
                 },
-                "actions": [
-                    {
-                        "type": "send_message",
-                        "parameters": {
-                            "message": "📅 Meeting in 15 minutes: {meeting_title}. Here's the agenda and prep materials.",
-                            "recipient": "self"
-                        },
-                        "service": "slack",
-                        "delay_seconds": 0
-                    }
-                ],
-                "conditions": ["upcoming_meeting"]
+                "service": "slack",
+                "delay_seconds": 0
             },
-            "evening_wind_down": {
-                "name": "Evening Wind Down",
-                "description": "Helps transition from work to personal time",
-                "trigger": {
-                    "type": "time_based",
-                    "condition": "0 18 * * *",  # 6 PM daily
-                    "parameters": {}
+            {
+                "type": "set_reminder",
+                "parameters": {
+                    "message": "Time for a break!",
+                    "delay_minutes": 25
+                },
+                "service": "system",
+                "delay_seconds": 0
+            }
+        ],
+        "conditions": []
+    },
+    "meeting_preparation": {
+        "name": "Meeting Preparation",
+        "description": "Prepares for upcoming meetings with relevant information",
+        "trigger": {
+            "type": "time_based",
+            "condition": "15 * * * *",  # Every 15 minutes
+            "parameters": {}
+        },
+        "actions": [
+            {
+                "type": "send_message",
+                "parameters": {
+                    "message": "📅 Meeting in 15 minutes: {meeting_title}. Here's the agenda and prep materials.",
+                    "recipient": "self"
+                },
+                "service": "slack",
+                "delay_seconds": 0
+            }
+        ],
+        "conditions": ["upcoming_meeting"]
+    },
+    "evening_wind_down": {
+        "name": "Evening Wind Down",
+        "description": "Helps transition from work to personal time",
+        "trigger": {
+            "type": "time_based",
+            "condition": "0 18 * * *",  # 6 PM daily
+            "parameters": {}
+        },
+        "actions": [
+            {
+                "type": "send_message",
+                "parameters": {
+                    "message": "🌅 Time to wind down! Here's your evening routine and tomorrow's preview.",
+                    "recipient": "self"
                 },
-                "actions": [
-                    {
-                        "type": "send_message",
-                        "parameters": {
-                            "message": "🌅 Time to wind down! Here's your evening routine and tomorrow's preview.",
-                            "recipient": "self"
-                        },
-                        "service": "slack",
-                        "delay_seconds": 0
-                    },
-                    {
-                        "type": "create_task",
-                        "parameters": {
-                            "title": "Evening reflection",
-                            "description": "Review today's accomplishments and plan for tomorrow",
-                            "priority": "medium"
-                        },
-                        "service": "auto",
-                        "delay_seconds": 0
-                    }
-                ],
-                "conditions": ["work_mode"]
+                "service": "slack",
+                "delay_seconds": 0
             },
-            "health_reminder": {
-                "name": "Health Reminder",
-                "description": "Reminds to take breaks and maintain health habits",
-                "trigger": {
-                    "type": "time_based",
-                    "condition": "0 */2 * * *",  # Every 2 hours
-                    "parameters": {}
+            {
+                "type": "create_task",
+                "parameters": {
+                    "title": "Evening reflection",
+                    "description": "Review today's accomplishments and plan for tomorrow",
+                    "priority": "medium"
                 },
-                "actions": [
-                    {
-                        "type": "send_message",
-                        "parameters": {
-                            "message": "💧 Time for a water break and stretch!",
-                            "recipient": "self"
-                        },
-                        "service": "slack",
-                        "delay_seconds": 0
-                    }
-                ],
-                "conditions": ["work_mode"]
+                "service": "auto",
+                "delay_seconds": 0
+            }
+        ],
+        "conditions": ["work_mode"]
+    },
+    "health_reminder": {
+        "name": "Health Reminder",
+        "description": "Reminds to take breaks and maintain health habits",
+        "trigger": {
+            "type": "time_based",
+            "condition": "0 */2 * * *",  # Every 2 hours
+            "parameters": {}
+        },
+        "actions": [
+            {
+                "type": "send_message",
+                "parameters": {
+                    "message": "💧 Time for a water break and stretch!",
+                    "recipient": "self"
+                },
+                "service": "slack",
+                "delay_seconds": 0
+            }
+        ],
+        "conditions": ["work_mode"]
+    },
+    "deadline_alert": {
+        "name": "Deadline Alert",
+        "description": "Alerts about upcoming deadlines and helps prioritize",
+        "trigger": {
+            "type": "condition_based",
+            "condition": "deadline_approaching",
+            "parameters": {
+                "hours_ahead": 24
+            }
+        },
+        "actions": [
+            {
+                "type": "send_message",
+                "parameters": {
+                    "message": "⚠️ Deadline approaching: {task_title} due in {time_remaining}",
+                    "recipient": "self"
+                },
+                "service": "slack",
+                "delay_seconds": 0
             },
-            "deadline_alert": {
-                "name": "Deadline Alert",
-                "description": "Alerts about upcoming deadlines and helps prioritize",
-                "trigger": {
-                    "type": "condition_based",
-                    "condition": "deadline_approaching",
-                    "parameters": {
-                        "hours_ahead": 24
-                    }
+            {
+                "type": "update_task",
+                "parameters": {
+                    "task_id": "{task_id}",
+                    "updates": {"priority": "urgent"}
                 },
-                "actions": [
-                    {
-                        "type": "send_message",
-                        "parameters": {
-                            "message": "⚠️ Deadline approaching: {task_title} due in {time_remaining}",
-                            "recipient": "self"
-                        },
-                        "service": "slack",
-                        "delay_seconds": 0
-                    },
-                    {
-                        "type": "update_task",
-                        "parameters": {
-                            "task_id": "{task_id}",
-                            "updates": {"priority": "urgent"}
-                        },
-                        "service": "auto",
-                        "delay_seconds": 0
-                    }
-                ],
-                "conditions": []
+                "service": "auto",
+                "delay_seconds": 0
             }
+        ],
+        "conditions": []
+    }
+}
+
+def _build_trigger(trigger: Dict) -> AutomationTrigger:
+    """Parse a trigger definition"""
+    return AutomationTrigger(
+        type=TriggerType(trigger['type']),
+        condition=trigger['condition'],
+        parameters=trigger.get('parameters', {})
+    )
+
+def _build_actions(actions: List[Dict]) -> List[AutomationAction]:
+    """Parse a list of action definitions"""
+    return [
+        AutomationAction(
+            type=ActionType(action_data['type']),
+            parameters=_compile_parameters(action_data['parameters']),
+            service=action_data.get('service', 'auto'),
+            delay_seconds=action_data.get('delay_seconds', 0)
+        )
+        for action_data in actions
+    ]
+
+# Templates parsed once at import; instances share their trigger and actions
+_TEMPLATES = {
+    template_id: Automation(
+        id=template_id,
+        name=spec['name'],
+        description=spec['description'],
+        trigger=_build_trigger(spec['trigger']),
+        actions=_build_actions(spec['actions']),
+        conditions=spec['conditions'],
+        created_at=0
+    )
+    for template_id, spec in _TEMPLATE_SPECS.items()
+}
+
+class AutomationEngine:
+    """
+    Advanced automation engine that creates intelligent workflows
+    between different services and reduces manual work
+    """
+    
+    def __init__(self, service_manager, context_engine, autostart: bool = True):
+        self.service_manager = service_manager
+        self.context_engine = context_engine
+        # Registry split by status so the scheduler only ever sees enabled automations
+        self._enabled = {}
+        self._disabled = {}
+        self.states = {}
+        self._compiled = {}
+        
+        # get_active_automations result, rebuilt only after the registry changes
+        self._active_cache = None
+        self._active_entries = {}
+        self._cache_dirty = True
+        
+        # Ids stay unique however many automations are created per second
+        self._id_counter = itertools.count(time.time_ns())
+        self.running = False
+        self.worker_thread = None
+        self.worker_task = None
+        self.loop = None
+        
+        # Scheduled runs in flight; the loop only holds weak references to tasks
+        self._running_tasks = set()
+        
+        # Min-heap of [next_fire_ts, automation_id, cancelled] entries; _timers
+        # holds each automation's live entry so cancelling is a flag flip
+        self._timer_heap = []
+        self._timers = {}
+        self._timer_lock = Lock()
+        self._wake = None
+        
+        # Bound service manager methods, resolved once
+        self._sm_send = self._bind_service('send_message')
+        self._sm_create_task = self._bind_service('create_task')
+        self._sm_update_task = self._bind_service('update_task')
+        self._sm_create_event = self._bind_service('create_calendar_event')
+        
+        # Action type -> handler, looked up once per action
+        self._action_handlers = {
+            ActionType.SEND_MESSAGE: self._handle_send_message,
+            ActionType.CREATE_TASK: self._handle_create_task,
+            ActionType.UPDATE_TASK: self._handle_update_task,
+            ActionType.SEND_EMAIL: self._handle_send_email,
+            ActionType.CREATE_CALENDAR_EVENT: self._handle_create_calendar_event,
+            ActionType.PLAY_MUSIC: self._handle_play_music,
+            ActionType.SET_REMINDER: self._handle_set_reminder,
+            ActionType.LOG_ACTIVITY: self._handle_log_activity,
         }
+        
+        # Pre-built automation templates
+        self.templates = _TEMPLATES
+        
+        # Start the automation worker; servers with their own event loop pass
+        # autostart=False and call start_worker() once that loop is running
+        if autostart:
+            self.start_worker()
     
     def create_automation(self, name: str, trigger: Dict, actions: List[Dict], 
                          conditions: List[str] = None) -> Dict:
         """Create a new automation"""
-        automation_id = f"auto_{int(datetime.now().timestamp())}"
-        
-        # Parse trigger
-        trigger_obj = AutomationTrigger(
-            type=TriggerType(trigger['type']),
-            condition=trigger['condition'],
-            parameters=trigger.get('parameters', {})
-        )
-        
-        # Parse actions
-        action_objs = []
-        for action_data in actions:
-            action_obj = AutomationAction(
-                type=ActionType(action_data['type']),
-                parameters=action_data['parameters'],
-                service=action_data.get('service', 'auto'),
-                delay_seconds=action_data.get('delay_seconds', 0)
-            )
-            action_objs.append(action_obj)
-        
-        # Create automation
         automation = Automation(
-            id=automation_id,
+            id=f"auto_{next(self._id_counter)}",
             name=name,
             description=f"Custom automation: {name}",
-            trigger=trigger_obj,
-            actions=action_objs,
+            trigger=_build_trigger(trigger),
+            actions=_build_actions(actions),
             conditions=conditions or [],
-            enabled=True,
-            created_at=datetime.now(),
-            last_run=None,
-            run_count=0,
-            success_rate=1.0
+            created_at=time.time_ns()
         )
-        
-        # Store automation
-        self.automations[automation_id] = automation
+        return self._register_automation(automation)
+    
+    def _register_automation(self, automation: Automation) -> Dict:
+        """Store a new automation and schedule it if time-based"""
+        self._enabled[automation.id] = automation
+        self.states[automation.id] = AutomationState()
+        self._compiled[automation.id] = tuple(self._compile_action(action) for action in automation.actions)
+        self._cache_dirty = True
         
         # Schedule if time-based
-        if trigger_obj.type == TriggerType.TIME_BASED:
+        if automation.trigger.type == TriggerType.TIME_BASED:
             self._schedule_automation(automation)
         
         return {
-            "id": automation_id,
-            "name": name,
+            "id": automation.id,
+            "name": automation.name,
             "status": "created",
-            "message": f"Automation '{name}' created successfully"
+            "message": f"Automation '{automation.name}' created successfully"
         }
     
     def create_from_template(self, template_name: str, customizations: Dict = None) -> Dict:
@@ -349,18 +584,33 @@ class AutomationEngine:
         
         template = self.templates[template_name]
         customizations = customizations or {}
+        name = customizations.get('name', template.name)
+        # Only the fields the caller actually overrides are rebuilt
+        overrides = {'name': name, 'description': f"Custom automation: {name}"}
+        if customizations:
+            if customizations.get('trigger'):
+                overrides['trigger'] = _build_trigger({**_TEMPLATE_SPECS[template_name]['trigger'], **customizations['trigger']})
+            if 'actions' in customizations:
+                overrides['actions'] = _build_actions(customizations['actions'])
+            if 'conditions' in customizations:
+                overrides['conditions'] = customizations['conditions'] or []
         
-        # Merge template with customizations
-        name = customizations.get('name', template['name'])
-        trigger = {**template['trigger'], **customizations.get('trigger', {})}
-        actions = customizations.get('actions', template['actions'])
-        conditions = customizations.get('conditions', template['conditions'])
-        
-        return self.create_automation(name, trigger, actions, conditions)
+        # Everything else is shared with the pre-parsed template
+        return self._register_automation(replace(
+            template,
+            id=f"auto_{next(self._id_counter)}",
+            created_at=time.time_ns(),
+            **overrides
+        ))
     
     def get_active_automations(self) -> List[Dict]:
         """Get all active automations"""
-        return [
+        if not self._cache_dirty:
+            return self._active_cache
+        
+        self._cache_dirty = False
+        states = self.states
+        self._active_cache = [
             {
                 "id": auto.id,
                 "name": auto.name,
@@ -368,21 +618,26 @@ class AutomationEngine:
                 "trigger_type": auto.trigger.type.value,
                 "trigger_condition": auto.trigger.condition,
                 "actions_count": len(auto.actions),
-                "enabled": auto.enabled,
-                "last_run": auto.last_run.isoformat() if auto.last_run else None,
-                "run_count": auto.run_count,
-                "success_rate": auto.success_rate
+                "enabled": enabled,
+                "last_run": state.last_run_iso,
+                "run_count": state.run_count,
+                "success_rate": state.success_rate
             }
-            for auto in self.automations.values()
+            for enabled, registry in ((True, self._enabled), (False, self._disabled))
+            for auto in registry.values()
+            for state in (states[auto.id],)
         ]
+        self._active_entries = {entry["id"]: entry for entry in self._active_cache}
+        return self._active_cache
     
     def enable_automation(self, automation_id: str) -> Dict:
         """Enable an automation"""
-        if automation_id not in self.automations:
+        automation = self._disabled.pop(automation_id, None) or self._enabled.get(automation_id)
+        if automation is None:
             return {"error": "Automation not found"}
         
-        automation = self.automations[automation_id]
-        automation.enabled = True
+        self._enabled[automation_id] = automation
+        self._cache_dirty = True
         
         # Re-schedule if time-based
         if automation.trigger.type == TriggerType.TIME_BASED:
@@ -392,80 +647,111 @@ class AutomationEngine:
     
     def disable_automation(self, automation_id: str) -> Dict:
         """Disable an automation"""
-        if automation_id not in self.automations:
+        automation = self._enabled.pop(automation_id, None) or self._disabled.get(automation_id)
+        if automation is None:
             return {"error": "Automation not found"}
         
-        automation = self.automations[automation_id]
-        automation.enabled = False
+        self._disabled[automation_id] = automation
+        self._cache_dirty = True
         
         # Unschedule if time-based
         if automation.trigger.type == TriggerType.TIME_BASED:
-            schedule.clear(automation_id)
+            self._unschedule_automation(automation_id)
         
         return {"success": True, "message": f"Automation '{automation.name}' disabled"}
     
     def delete_automation(self, automation_id: str) -> Dict:
         """Delete an automation"""
-        if automation_id not in self.automations:
+        automation = self._enabled.get(automation_id) or self._disabled.get(automation_id)
+        if automation is None:
             return {"error": "Automation not found"}
         
-        automation = self.automations[automation_id]
-        
         # Unschedule if time-based
         if automation.trigger.type == TriggerType.TIME_BASED:
-            schedule.clear(automation_id)
+            self._unschedule_automation(automation_id)
         
         # Remove from storage
-        del self.automations[automation_id]
+        self._enabled.pop(automation_id, None)
+        self._disabled.pop(automation_id, None)
+        del self.states[automation_id]
+        del self._compiled[automation_id]
+        self._cache_dirty = True
         
         return {"success": True, "message": f"Automation '{automation.name}' deleted"}
     
     def trigger_automation(self, automation_id: str, context: Dict = None) -> Dict:
-        """Manually trigger an automation"""
-        if automation_id not in self.automations:
+        """Manually trigger an automation from a thread other than the worker loop's"""
+        if self.loop is None or not self.loop.is_running():
+            raise RuntimeError("Automation worker is not running; call start_worker() first")
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self.loop:
+            # Blocking on the loop that has to run the automation would deadlock it
+            raise RuntimeError("trigger_automation() can't be called from the worker loop; "
+                               "await trigger_automation_async() instead")
+        return asyncio.run_coroutine_threadsafe(
+            self.trigger_automation_async(automation_id, context), self.loop
+        ).result()
+    
+    async def trigger_automation_async(self, automation_id: str, context: Dict = None) -> Dict:
+        """Manually trigger an automation; must be awaited on the worker loop"""
+        automation = self._enabled.get(automation_id)
+        if automation is None:
+            if automation_id in self._disabled:
+                return {"error": "Automation is disabled"}
             return {"error": "Automation not found"}
         
-        automation = self.automations[automation_id]
-        if not automation.enabled:
-            return {"error": "Automation is disabled"}
-        
         # Check conditions
         if not self._check_conditions(automation.conditions, context or {}):
             return {"error": "Automation conditions not met"}
         
         # Execute automation
-        result = self._execute_automation(automation, context or {})
-        
-        # Update automation stats
-        automation.last_run = datetime.now()
-        automation.run_count += 1
-        
-        return result
+        return await self._execute_automation(automation, context or {})
     
     def _schedule_automation(self, automation: Automation):
         """Schedule a time-based automation"""
         if automation.trigger.type != TriggerType.TIME_BASED:
             return
         
-        cron_expression = automation.trigger.condition
-        
-        # Convert cron to schedule format (simplified)
-        if cron_expression == "0 8 * * *":  # 8 AM daily
-            schedule.every().day.at("08:00").do(
-                self._execute_automation, automation, {}
-            ).tag(automation.id)
-        elif cron_expression == "0 18 * * *":  # 6 PM daily
-            schedule.every().day.at("18:00").do(
-                self._execute_automation, automation, {}
-            ).tag(automation.id)
-        elif cron_expression == "0 */2 * * *":  # Every 2 hours
-            schedule.every(2).hours.do(
-                self._execute_automation, automation, {}
-            ).tag(automation.id)
-        elif cron_expression == "15 * * * *":  # Every 15 minutes
-            schedule.every(15).minutes.do(
-                self._execute_automation, automation, {}
-            ).tag(automation.id)
+        due = self._next_fire(automation.trigger.condition, time.time())
+        if due is None:
+            print(f"Unsupported cron expression for automation {automation.id}: {automation.trigger.condition}")
+            return
+        
+        with self._timer_lock:
+            self._push_timer(automation.id, due)
+        self._wake_worker()
+    
+    def _push_timer(self, automation_id: str, due: float):
+        """Replace an automation's timer entry; the caller holds _timer_lock"""
+        entry = self._timers.get(automation_id)
+        if entry is not None:
+            entry[2] = True
+        entry = self._timers[automation_id] = [due, automation_id, False]
+        heapq.heappush(self._timer_heap, entry)
+    
+    def _unschedule_automation(self, automation_id: str):
+        """Drop a time-based automation from the timer heap"""
+        # The heap entry itself is discarded lazily when it reaches the top
+        with self._timer_lock:
+            entry = self._timers.pop(automation_id, None)
+            if entry is not None:
+                entry[2] = True
+        self._wake_worker()
+    
+    def _next_fire(self, cron_expression: str, now: float) -> Optional[float]:
+        """Get the next fire timestamp of a cron expression after now"""
+        next_fire = _CRON_NEXT_FIRE.get(cron_expression)
+        if next_fire is not None:
+            return next_fire(now)
+        return _cron_next_fire(cron_expression, now)
+    
+    def _wake_worker(self):
+        """Wake the worker so it re-reads the head of the timer heap"""
+        if self.loop is not None and self._wake is not None:
+            self.loop.call_soon_threadsafe(self._wake.set)
     
     def _check_conditions(self, conditions: List[str], context: Dict) -> bool:
         """Check if automation conditions are met"""
@@ -493,30 +779,29 @@ class AutomationEngine:
         # For now, return False as placeholder
         return False
     
-    def _execute_automation(self, automation: Automation, context: Dict) -> Dict:
+    async def _execute_automation(self, automation: Automation, context: Dict,
+                                  collect_results: bool = True) -> Optional[Dict]:
         """Execute an automation's actions"""
-        results = []
+        # It may have been disabled between being scheduled and running
+        if automation.id not in self._enabled:
+            return {"error": "Automation is disabled"} if collect_results else None
         
-        for action in automation.actions:
-            try:
-                # Apply delay if specified
-                if action.delay_seconds > 0:
-                    time.sleep(action.delay_seconds)
-                
-                # Execute action
-                result = self._execute_action(action, context)
-                results.append({
-                    "action": action.type.value,
-                    "success": True,
-                    "result": result
-                })
-                
-            except Exception as e:
-                results.append({
-                    "action": action.type.value,
-                    "success": False,
-                    "error": str(e)
-                })
+        # Actions are independent, so they run concurrently and every delay
+        # counts from the start of the run rather than from the previous action
+        steps = self._compiled.get(automation.id, ())
+        if not collect_results:
+            # Scheduled runs have no caller to report to, so skip the per-action bookkeeping
+            outcomes = await asyncio.gather(*[step(context) for step in steps], return_exceptions=True)
+            errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+            for error in errors:
+                print(f"Error in automation {automation.id}: {error}")
+            self._record_run(automation.id, not errors)
+            return None
+        
+        results = await asyncio.gather(*[
+            self._run_action(action, step, context) for action, step in zip(automation.actions, steps)
+        ])
+        self._record_run(automation.id, all(result["success"] for result in results))
         
         return {
             "automation_id": automation.id,
@@ -525,107 +810,221 @@ class AutomationEngine:
             "results": results
         }
     
-    def _execute_action(self, action: AutomationAction, context: Dict) -> Dict:
-        """Execute a single action"""
-        action_type = action.type
+    def _record_run(self, automation_id: str, succeeded: bool):
+        """Update run stats, patching the cached listing entry in place"""
+        state = self.states.get(automation_id)
+        if state is None:
+            return
+        
+        last_run = (time.time_ns(), succeeded)
+        state.last_run = last_run
+        state.last_run_iso = datetime.fromtimestamp(last_run[0] / 1e9).isoformat()
+        state.run_count = next(state.runs) + 1
+        state.outcomes.append(succeeded)
+        entry = self._active_entries.get(automation_id)
+        if entry is not None:
+            entry["last_run"] = state.last_run_iso
+            entry["run_count"] = state.run_count
+            entry["success_rate"] = state.success_rate
+    
+    def _compile_action(self, action: AutomationAction) -> Callable[[Dict], Awaitable[Dict]]:
+        """Specialize an action into a coroutine function of the run context"""
+        handler = self._action_handlers.get(action.type)
         params = action.parameters
         service = action.service
+        delay = action.delay_seconds
+        templated = tuple(key for key, value in params.items() if type(value) is _Template)
         
-        # Replace placeholders in parameters
-        params = self._replace_placeholders(params, context)
-        
-        if action_type == ActionType.SEND_MESSAGE:
-            return self.service_manager.send_message(
-                message=params['message'],
-                recipient=params['recipient'],
-                channel=service
-            )
-        
-        elif action_type == ActionType.CREATE_TASK:
-            return self.service_manager.create_task(
-                title=params['title'],
-                description=params.get('description', ''),
-                priority=params.get('priority', 'medium'),
-                due_date=params.get('due_date'),
-                service=service
-            )
-        
-        elif action_type == ActionType.UPDATE_TASK:
-            return self.service_manager.update_task(
-                task_id=params['task_id'],
-                updates=params['updates']
-            )
-        
-        elif action_type == ActionType.SEND_EMAIL:
-            return self.service_manager.send_message(
-                message=params['message'],
-                recipient=params['recipient'],
-                channel='email'
-            )
-        
-        elif action_type == ActionType.CREATE_CALENDAR_EVENT:
-            return self.service_manager.create_calendar_event(
-                title=params['title'],
-                start_time=params['start_time'],
-                end_time=params['end_time'],
-                description=params.get('description', '')
-            )
-        
-        elif action_type == ActionType.PLAY_MUSIC:
-            # This would integrate with Spotify or other music services
-            return {"success": True, "message": f"Playing music: {params.get('playlist', 'default')}"}
-        
-        elif action_type == ActionType.SET_REMINDER:
-            # This would set a system reminder
-            return {"success": True, "message": f"Reminder set: {params['message']}"}
-        
-        elif action_type == ActionType.LOG_ACTIVITY:
-            # Log activity for analytics
-            return {"success": True, "message": "Activity logged"}
+        async def step(context: Dict) -> Dict:
+            # Apply delay if specified
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if handler is None:
+                return {"error": f"Unknown action type: {action.type}"}
+            
+            if not templated:
+                return await handler(params, service)
+            
+            # Replace placeholders in parameters
+            rendered = dict(params)
+            for key in templated:
+                rendered[key] = params[key].render(context)
+            return await handler(rendered, service)
         
-        else:
-            return {"error": f"Unknown action type: {action_type}"}
+        return step
+    
+    async def _run_action(self, action: AutomationAction, step: Callable[[Dict], Awaitable[Dict]],
+                          context: Dict) -> Dict:
+        """Execute a single compiled action and record the outcome"""
+        try:
+            result = await step(context)
+            return {
+                "action": action.type.value,
+                "success": True,
+                "result": result
+            }
+            
+        except Exception as e:
+            return {
+                "action": action.type.value,
+                "success": False,
+                "error": str(e)
+            }
+    
+    def _bind_service(self, name: str) -> Callable[..., Awaitable[Dict]]:
+        """Resolve a service manager method once into an awaitable callable"""
+        method = getattr(self.service_manager, name, None)
+        if method is None:
+            async def missing(**kwargs) -> Dict:
+                raise AttributeError(f"'{type(self.service_manager).__name__}' object has no attribute '{name}'")
+            return missing
+        if inspect.iscoroutinefunction(method):
+            return method
+        
+        # Synchronous service calls run in the default executor
+        async def call(**kwargs) -> Dict:
+            return await asyncio.get_running_loop().run_in_executor(None, partial(method, **kwargs))
+        return call
+    
+    async def _handle_send_message(self, params: Dict, service: str) -> Dict:
+        return await self._sm_send(
+            message=params['message'],
+            recipient=params['recipient'],
+            channel=service
+        )
+    
+    async def _handle_create_task(self, params: Dict, service: str) -> Dict:
+        return await self._sm_create_task(
+            title=params['title'],
+            description=params.get('description', ''),
+            priority=params.get('priority', 'medium'),
+            due_date=params.get('due_date'),
+            service=service
+        )
+    
+    async def _handle_update_task(self, params: Dict, service: str) -> Dict:
+        return await self._sm_update_task(
+            task_id=params['task_id'],
+            updates=params['updates']
+        )
+    
+    async def _handle_send_email(self, params: Dict, service: str) -> Dict:
+        return await self._sm_send(
+            message=params['message'],
+            recipient=params['recipient'],
+            channel='email'
+        )
+    
+    async def _handle_create_calendar_event(self, params: Dict, service: str) -> Dict:
+        return await self._sm_create_event(
+            title=params['title'],
+            start_time=params['start_time'],
+            end_time=params['end_time'],
+            description=params.get('description', '')
+        )
     
-    def _replace_placeholders(self, params: Dict, context: Dict) -> Dict:
-        """Replace placeholders in parameters with actual values"""
-        # This would replace placeholders like {meeting_title} with actual values
-        # For now, return params as-is
-        return params
+    async def _handle_play_music(self, params: Dict, service: str) -> Dict:
+        # This would integrate with Spotify or other music services
+        return {"success": True, "message": f"Playing music: {params.get('playlist', 'default')}"}
+    
+    async def _handle_set_reminder(self, params: Dict, service: str) -> Dict:
+        # This would set a system reminder
+        return {"success": True, "message": f"Reminder set: {params['message']}"}
+    
+    async def _handle_log_activity(self, params: Dict, service: str) -> Dict:
+        # Log activity for analytics
+        return {"success": True, "message": "Activity logged"}
     
     def start_worker(self):
-        """Start the automation worker thread"""
+        """Start the automation worker, on the running event loop if there is one"""
         if self.running:
             return
         
         self.running = True
-        self.worker_thread = Thread(target=self._worker_loop, daemon=True)
+        if njit is not None:
+            # Compile the cron kernel now instead of on the first request that needs it
+            _cron_next_fire("* * * * *", time.time())
+        try:
+            # No extra thread needed when called from an async server
+            self.loop = asyncio.get_running_loop()
+            self.worker_task = self.loop.create_task(self._worker_loop())
+            return
+        except RuntimeError:
+            pass
+        
+        self.loop = asyncio.new_event_loop()
+        if hasattr(asyncio, 'eager_task_factory'):
+            # Python 3.12+: tasks that finish without suspending skip the scheduler
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        self.worker_thread = Thread(target=self._run_loop, daemon=True)
         self.worker_thread.start()
     
     def stop_worker(self):
-        """Stop the automation worker thread"""
+        """Stop the automation worker"""
         self.running = False
+        if self.worker_task:
+            self.worker_task.cancel()
+            self.worker_task = None
         if self.worker_thread:
+            self._wake_worker()
             self.worker_thread.join()
+            self.worker_thread = None
     
-    def _worker_loop(self):
+    def _run_loop(self):
+        """Run the worker event loop until the worker is stopped"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._worker_loop())
+    
+    async def _worker_loop(self):
         """Main worker loop for executing scheduled automations"""
+        self._wake = asyncio.Event()
         while self.running:
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                self._wake.clear()
+                now = time.time()
+                with self._timer_lock:
+                    while self._timer_heap and self._timer_heap[0][2]:
+                        heapq.heappop(self._timer_heap)
+                    if not self._timer_heap or self._timer_heap[0][0] > now:
+                        timeout = self._timer_heap[0][0] - now if self._timer_heap else 60
+                        automation = None
+                    else:
+                        _, automation_id, _ = heapq.heappop(self._timer_heap)
+                        automation = self._enabled.get(automation_id)
+                        if automation is None:
+                            self._timers.pop(automation_id, None)
+                            continue
+                        self._push_timer(automation_id, self._next_fire(automation.trigger.condition, now))
+                
+                if automation is None:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                
+                task = self.loop.create_task(self._execute_automation(automation, {}, collect_results=False))
+                self._running_tasks.add(task)
+                task.add_done_callback(self._scheduled_run_done)
             except Exception as e:
                 print(f"Error in automation worker: {e}")
-                time.sleep(5)
+                await asyncio.sleep(5)
+    
+    def _scheduled_run_done(self, task: asyncio.Task):
+        """Forget a finished scheduled run and report it if it failed"""
+        self._running_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error in scheduled automation: {task.exception()}")
     
     def get_automation_templates(self) -> List[Dict]:
         """Get available automation templates"""
         return [
             {
                 "id": template_id,
-                "name": template["name"],
-                "description": template["description"],
-                "trigger_type": template["trigger"]["type"],
-                "actions_count": len(template["actions"])
+                "name": template.name,
+                "description": template.description,
+                "trigger_type": template.trigger.type.value,
+                "actions_count": len(template.actions)
             }
             for template_id, template in self.templates.items()
         ]
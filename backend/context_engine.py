@@ -6,12 +6,18 @@ Understands user's situation, preferences, and patterns to provide intelligent a
 import os
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import asyncio
-import aiohttp
-from dataclasses import dataclass
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, fields
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class EnergyLevel(Enum):
     HIGH = "high"
     MEDIUM = "medium"
@@ -25,7 +31,31 @@ class TimeOfDay(Enum):
     EVENING = "evening"              # 5-9 PM
     NIGHT = "night"                  # 9 PM-5 AM
 
-@dataclass
+# Time of day for each hour, indexed by datetime.hour
+_HOUR_TO_TOD = tuple(
+    TimeOfDay.EARLY_MORNING if 5 <= h < 8 else
+    TimeOfDay.MORNING if 8 <= h < 12 else
+    TimeOfDay.AFTERNOON if 12 <= h < 17 else
+    TimeOfDay.EVENING if 17 <= h < 21 else
+    TimeOfDay.NIGHT
+    for h in range(24)
+)
+
+# Typical energy level per time of day; anything else counts as low
+_ENERGY_BY_TOD = {
+    TimeOfDay.MORNING: EnergyLevel.HIGH,
+    TimeOfDay.AFTERNOON: EnergyLevel.MEDIUM,
+    TimeOfDay.EVENING: EnergyLevel.LOW,
+}
+
+# Pattern keys for every (time of day, energy level) pair, built once
+_PATTERN_KEY = {
+    (time_of_day, energy_level): f"{time_of_day.value}_{energy_level.value}"
+    for time_of_day in TimeOfDay
+    for energy_level in EnergyLevel
+}
+
+@dataclass(slots=True)
 class UserContext:
     """Current user context and state"""
     current_time: datetime
@@ -42,16 +72,161 @@ class UserContext:
     work_mode: bool
     personal_mode: bool
 
-@dataclass
-class LifeMetrics:
-    """Comprehensive life tracking metrics"""
-    health: Dict[str, Any]
-    finance: Dict[str, Any]
-    learning: Dict[str, Any]
-    habits: Dict[str, Any]
-    relationships: Dict[str, Any]
-    career: Dict[str, Any]
-    personal_growth: Dict[str, Any]
+# Default life metrics per category; copied per engine on first use
+_DEFAULT_METRICS = {
+    'health': {
+        'sleep_hours': 7.5,
+        'exercise_minutes': 30,
+        'water_intake': 8,
+        'stress_level': 0.3,
+        'energy_level': 0.7,
+        'mood_score': 0.6
+    },
+    'finance': {
+        'monthly_income': 5000,
+        'monthly_expenses': 3500,
+        'savings_rate': 0.3,
+        'investment_growth': 0.08,
+        'debt_level': 0.2,
+        'financial_stress': 0.4
+    },
+    'learning': {
+        'hours_per_week': 5,
+        'courses_completed': 2,
+        'skills_learned': 3,
+        'learning_streak': 7,
+        'knowledge_areas': ['programming', 'design', 'business'],
+        'learning_velocity': 0.6
+    },
+    'habits': {
+        'morning_routine': True,
+        'exercise_consistency': 0.8,
+        'meditation_practice': 0.6,
+        'reading_habit': 0.7,
+        'journaling': 0.4,
+        'habit_streak': 21
+    },
+    'relationships': {
+        'family_time': 10,  # hours per week
+        'friend_connections': 5,
+        'romantic_relationship': True,
+        'social_energy': 0.6,
+        'communication_frequency': 0.8,
+        'relationship_satisfaction': 0.7
+    },
+    'career': {
+        'job_satisfaction': 0.7,
+        'productivity_score': 0.8,
+        'skill_development': 0.6,
+        'work_life_balance': 0.5,
+        'career_growth': 0.6,
+        'team_collaboration': 0.8
+    },
+    'personal_growth': {
+        'goal_achievement': 0.6,
+        'self_reflection': 0.7,
+        'creativity_expression': 0.5,
+        'spiritual_practice': 0.3,
+        'hobby_engagement': 0.6,
+        'personal_fulfillment': 0.6
+    }
+}
+
+# Field names accepted by update_context / update_life_metrics
+_UC_FIELDS = frozenset(f.name for f in fields(UserContext))
+_LM_FIELDS = frozenset(_DEFAULT_METRICS)
+
+# Inputs to the overall life score: (category, metric, default, scale, invert)
+_SCORE_EXTRACTORS = (
+    ('health', 'mood_score', 0.5, 1, False),
+    ('finance', 'financial_stress', 0.5, 1, True),  # Invert stress
+    ('learning', 'learning_velocity', 0.5, 1, False),
+    ('habits', 'habit_streak', 0, 30, False),  # Normalize to 0-1
+    ('relationships', 'relationship_satisfaction', 0.5, 1, False),
+    ('career', 'job_satisfaction', 0.5, 1, False),
+    ('personal_growth', 'personal_fulfillment', 0.5, 1, False),
+)
+
+# Static insights, shared by every get_insights call; treat as read-only
+_INSIGHT_HIGH_ENERGY = {
+    'type': 'productivity',
+    'title': 'High Energy Window',
+    'message': 'You have high energy right now - perfect for tackling challenging tasks!',
+    'action': 'Focus on your most important or difficult tasks',
+    'priority': 'high'
+}
+_INSIGHT_LOW_ENERGY = {
+    'type': 'wellness',
+    'title': 'Low Energy Detected',
+    'message': 'Your energy is low - consider taking a break or doing lighter tasks.',
+    'action': 'Take a 15-minute break or switch to administrative tasks',
+    'priority': 'medium'
+}
+_INSIGHT_MORNING = {
+    'type': 'planning',
+    'title': 'Morning Planning',
+    'message': 'Good morning! This is a great time to plan your day.',
+    'action': 'Review your tasks and set priorities for the day',
+    'priority': 'medium'
+}
+_INSIGHT_EVENING = {
+    'type': 'reflection',
+    'title': 'Evening Reflection',
+    'message': 'Time to reflect on your day and prepare for tomorrow.',
+    'action': 'Review completed tasks and plan for tomorrow',
+    'priority': 'medium'
+}
+_INSIGHT_LOW_BALANCE = {
+    'type': 'wellness',
+    'title': 'Life Balance Alert',
+    'message': 'Your overall life satisfaction is below average. Consider focusing on self-care.',
+    'action': 'Take time for activities that bring you joy',
+    'priority': 'high'
+}
+_INSIGHT_HIGH_BALANCE = {
+    'type': 'celebration',
+    'title': 'Life Balance Excellent',
+    'message': 'Your life balance is excellent! Keep up the great work.',
+    'action': 'Continue your current practices',
+    'priority': 'low'
+}
+
+# Placeholder analytics patterns, shared by every get_analytics call; treat as read-only
+_PEAK_HOURS = (9, 10, 11, 14, 15)
+_COMMON_ACTIVITIES = ("email", "meetings", "coding", "planning")
+_ENERGY_PATTERNS = {
+    "morning": "high",
+    "afternoon": "medium",
+    "evening": "low"
+}
+_COMMUNICATION_PATTERNS = {
+    "email": 0.4,
+    "slack": 0.3,
+    "phone": 0.2,
+    "in_person": 0.1
+}
+
+def _suggest_task_planning(user_context: UserContext) -> List[str]:
+    if user_context.energy_level is EnergyLevel.HIGH:
+        return ["Focus on your most challenging tasks now"]
+    return ["Start with quick, easy tasks to build momentum"]
+
+def _suggest_communication(user_context: UserContext) -> List[str]:
+    if user_context.time_of_day is TimeOfDay.MORNING:
+        return ["Send important emails now for better response rates"]
+    return ["Use Slack for quick updates, save emails for tomorrow"]
+
+def _suggest_break_planning(user_context: UserContext) -> List[str]:
+    if user_context.stress_level > 0.7:
+        return ["Take a longer break - try meditation or a walk"]
+    return ["A 5-minute break should be sufficient"]
+
+# Suggestion builders by get_personalized_suggestions context name
+_SUGGESTION_HANDLERS = {
+    'task_planning': _suggest_task_planning,
+    'communication': _suggest_communication,
+    'break_planning': _suggest_break_planning,
+}
 
 class ContextEngine:
     """
@@ -63,16 +238,36 @@ class ContextEngine:
         self.user_context = None
         self.life_metrics = None
         self.user_preferences = {}
-        self.patterns = {}
-        self.insights_history = []
+        self.patterns = Counter()  # "time_of_day_energy_level" -> frequency
+        self._top_pattern_key = None
+        self._top_pattern_freq = 0
+        self.insights_history = deque(maxlen=1000)  # most recent insights only
         self.analytics_data = {}
+        self._static_analytics = None
+        
+        # Serialized views, rebuilt only when their version moves on
+        self._context_version = 0
+        self._context_cache = None
+        self._context_cache_version = -1
+        self._context_json = None
+        self._context_json_version = -1
+        self._metrics_version = 0
+        self._metrics_cache = None
+        self._metrics_cache_version = -1
+        self._overall_score_cache = None
+        self._overall_score_version = -1
+        
+        # Wall clock reading reused for up to a second
+        self._last_now_ts = 0.0
+        self._last_now_dt = None
+        self._last_now_iso = None
         
         # Initialize with default context
         self._initialize_default_context()
     
     def _initialize_default_context(self):
         """Initialize with default context values"""
-        now = datetime.now()
+        now = self._now()
         self.user_context = UserContext(
             current_time=now,
             time_of_day=self._determine_time_of_day(now),
@@ -89,51 +284,44 @@ class ContextEngine:
             personal_mode=False
         )
     
+    def _now(self) -> datetime:
+        """Get the current time, refreshed at most once per second"""
+        ts = time.time()
+        if ts - self._last_now_ts > 1.0:
+            self._last_now_dt = datetime.fromtimestamp(ts)
+            self._last_now_iso = self._last_now_dt.isoformat()
+            self._last_now_ts = ts
+        return self._last_now_dt
+    
     def _determine_time_of_day(self, time: datetime) -> TimeOfDay:
         """Determine time of day based on current time"""
-        hour = time.hour
-        
-        if 5 <= hour < 8:
-            return TimeOfDay.EARLY_MORNING
-        elif 8 <= hour < 12:
-            return TimeOfDay.MORNING
-        elif 12 <= hour < 17:
-            return TimeOfDay.AFTERNOON
-        elif 17 <= hour < 21:
-            return TimeOfDay.EVENING
-        else:
-            return TimeOfDay.NIGHT
+        return _HOUR_TO_TOD[time.hour]
     
     def _determine_energy_level(self, context: Dict) -> EnergyLevel:
         """Determine energy level based on various factors"""
         # This would use ML models in a real implementation
-        time_of_day = context.get('time_of_day')
-        recent_activity = context.get('recent_activity', [])
-        stress_level = context.get('stress_level', 0.3)
-        
-        # Simple heuristic for now
-        if time_of_day == TimeOfDay.MORNING:
-            return EnergyLevel.HIGH
-        elif time_of_day == TimeOfDay.AFTERNOON:
-            return EnergyLevel.MEDIUM
-        elif time_of_day == TimeOfDay.EVENING:
-            return EnergyLevel.LOW
-        else:
-            return EnergyLevel.LOW
+        # Simple heuristic for now: time of day alone
+        return _ENERGY_BY_TOD.get(context.get('time_of_day'), EnergyLevel.LOW)
     
     def update_context(self, new_data: Dict = None):
         """Update user context with new information"""
         if new_data:
             # Update specific context fields
             for key, value in new_data.items():
-                if hasattr(self.user_context, key):
+                if key in _UC_FIELDS:
                     setattr(self.user_context, key, value)
         
         # Recalculate derived fields
-        now = datetime.now()
+        now = self._now()
         self.user_context.current_time = now
         self.user_context.time_of_day = self._determine_time_of_day(now)
-        self.user_context.energy_level = self._determine_energy_level(self.user_context.__dict__)
+        self.user_context.energy_level = self._determine_energy_level({
+            'time_of_day': self.user_context.time_of_day,
+            'recent_activity': self.user_context.recent_activity,
+            'stress_level': self.user_context.stress_level
+        })
+        
+        self._context_version += 1
         
         # Update patterns
         self._update_patterns()
@@ -143,22 +331,25 @@ class ContextEngine:
         # This would use ML to identify patterns
         # For now, we'll use simple heuristics
         
-        time_key = f"{self.user_context.time_of_day.value}_{self.user_context.energy_level.value}"
+        time_key = _PATTERN_KEY[(self.user_context.time_of_day, self.user_context.energy_level)]
+        self.patterns[time_key] += 1
         
-        if time_key not in self.patterns:
-            self.patterns[time_key] = {
-                'frequency': 0,
-                'common_activities': [],
-                'preferred_tasks': [],
-                'communication_preferences': []
-            }
-        
-        self.patterns[time_key]['frequency'] += 1
+        # Frequencies only ever grow by one, so the leader can be tracked as we go
+        frequency = self.patterns[time_key]
+        if frequency > self._top_pattern_freq:
+            self._top_pattern_freq = frequency
+            self._top_pattern_key = time_key
+        self._context_version += 1
     
     def get_context(self) -> Dict:
         """Get current user context"""
-        return {
-            'current_time': self.user_context.current_time.isoformat(),
+        if self._context_cache_version == self._context_version:
+            return self._context_cache
+        
+        self._context_cache_version = self._context_version
+        self._context_cache = {
+            # current_time is only ever set from _now(), so its ISO form is cached there
+            'current_time': self._last_now_iso,
             'time_of_day': self.user_context.time_of_day.value,
             'energy_level': self.user_context.energy_level.value,
             'location': self.user_context.location,
@@ -171,151 +362,85 @@ class ContextEngine:
             'preferred_communication': self.user_context.preferred_communication,
             'work_mode': self.user_context.work_mode,
             'personal_mode': self.user_context.personal_mode,
-            'patterns': self.patterns
+            'patterns': {
+                time_key: {
+                    'frequency': frequency,
+                    'common_activities': [],
+                    'preferred_tasks': [],
+                    'communication_preferences': []
+                }
+                for time_key, frequency in self.patterns.items()
+            }
         }
+        return self._context_cache
+    
+    def get_context_json(self) -> bytes:
+        """Get current user context serialized as JSON"""
+        if self._context_json_version == self._context_version:
+            return self._context_json
+        
+        context = self.get_context()
+        self._context_json_version = self._context_version
+        self._context_json = orjson.dumps(context) if orjson else json.dumps(context).encode()
+        return self._context_json
     
     def get_life_metrics(self) -> Dict:
         """Get comprehensive life metrics"""
         if not self.life_metrics:
             self.life_metrics = self._generate_default_life_metrics()
+            self._metrics_version += 1
         
-        return {
-            'health': self.life_metrics.health,
-            'finance': self.life_metrics.finance,
-            'learning': self.life_metrics.learning,
-            'habits': self.life_metrics.habits,
-            'relationships': self.life_metrics.relationships,
-            'career': self.life_metrics.career,
-            'personal_growth': self.life_metrics.personal_growth,
-            'overall_score': self._calculate_overall_score()
-        }
+        if self._metrics_cache_version == self._metrics_version:
+            return self._metrics_cache
+        
+        self._metrics_cache_version = self._metrics_version
+        self._metrics_cache = {**self.life_metrics, 'overall_score': self._calculate_overall_score()}
+        return self._metrics_cache
     
-    def _generate_default_life_metrics(self) -> LifeMetrics:
+    def _generate_default_life_metrics(self) -> Dict[str, Dict[str, Any]]:
         """Generate default life metrics"""
-        return LifeMetrics(
-            health={
-                'sleep_hours': 7.5,
-                'exercise_minutes': 30,
-                'water_intake': 8,
-                'stress_level': 0.3,
-                'energy_level': 0.7,
-                'mood_score': 0.6
-            },
-            finance={
-                'monthly_income': 5000,
-                'monthly_expenses': 3500,
-                'savings_rate': 0.3,
-                'investment_growth': 0.08,
-                'debt_level': 0.2,
-                'financial_stress': 0.4
-            },
-            learning={
-                'hours_per_week': 5,
-                'courses_completed': 2,
-                'skills_learned': 3,
-                'learning_streak': 7,
-                'knowledge_areas': ['programming', 'design', 'business'],
-                'learning_velocity': 0.6
-            },
-            habits={
-                'morning_routine': True,
-                'exercise_consistency': 0.8,
-                'meditation_practice': 0.6,
-                'reading_habit': 0.7,
-                'journaling': 0.4,
-                'habit_streak': 21
-            },
-            relationships={
-                'family_time': 10,  # hours per week
-                'friend_connections': 5,
-                'romantic_relationship': True,
-                'social_energy': 0.6,
-                'communication_frequency': 0.8,
-                'relationship_satisfaction': 0.7
-            },
-            career={
-                'job_satisfaction': 0.7,
-                'productivity_score': 0.8,
-                'skill_development': 0.6,
-                'work_life_balance': 0.5,
-                'career_growth': 0.6,
-                'team_collaboration': 0.8
-            },
-            personal_growth={
-                'goal_achievement': 0.6,
-                'self_reflection': 0.7,
-                'creativity_expression': 0.5,
-                'spiritual_practice': 0.3,
-                'hobby_engagement': 0.6,
-                'personal_fulfillment': 0.6
-            }
-        )
+        # Copy each category so updates never touch the shared defaults
+        return {category: dict(metrics) for category, metrics in _DEFAULT_METRICS.items()}
     
     def _calculate_overall_score(self) -> float:
         """Calculate overall life satisfaction score"""
         if not self.life_metrics:
             return 0.5
         
-        scores = [
-            self.life_metrics.health.get('mood_score', 0.5),
-            self.life_metrics.finance.get('financial_stress', 0.5),
-            1 - self.life_metrics.finance.get('financial_stress', 0.5),  # Invert stress
-            self.life_metrics.learning.get('learning_velocity', 0.5),
-            self.life_metrics.habits.get('habit_streak', 0) / 30,  # Normalize to 0-1
-            self.life_metrics.relationships.get('relationship_satisfaction', 0.5),
-            self.life_metrics.career.get('job_satisfaction', 0.5),
-            self.life_metrics.personal_growth.get('personal_fulfillment', 0.5)
-        ]
+        if self._overall_score_version == self._metrics_version:
+            return self._overall_score_cache
+        
+        total = 0.0
+        for category, key, default, scale, invert in _SCORE_EXTRACTORS:
+            value = self.life_metrics[category].get(key, default) / scale
+            total += 1 - value if invert else value
         
-        return sum(scores) / len(scores)
+        self._overall_score_version = self._metrics_version
+        self._overall_score_cache = total / len(_SCORE_EXTRACTORS)
+        return self._overall_score_cache
     
     def get_insights(self) -> List[Dict]:
         """Get AI-powered insights about user's digital life"""
         insights = []
         
         # Energy-based insights
-        if self.user_context.energy_level == EnergyLevel.HIGH:
-            insights.append({
-                'type': 'productivity',
-                'title': 'High Energy Window',
-                'message': 'You have high energy right now - perfect for tackling challenging tasks!',
-                'action': 'Focus on your most important or difficult tasks',
-                'priority': 'high'
-            })
-        elif self.user_context.energy_level == EnergyLevel.LOW:
-            insights.append({
-                'type': 'wellness',
-                'title': 'Low Energy Detected',
-                'message': 'Your energy is low - consider taking a break or doing lighter tasks.',
-                'action': 'Take a 15-minute break or switch to administrative tasks',
-                'priority': 'medium'
-            })
+        if self.user_context.energy_level is EnergyLevel.HIGH:
+            insights.append(_INSIGHT_HIGH_ENERGY)
+        elif self.user_context.energy_level is EnergyLevel.LOW:
+            insights.append(_INSIGHT_LOW_ENERGY)
         
         # Time-based insights
-        if self.user_context.time_of_day == TimeOfDay.MORNING:
-            insights.append({
-                'type': 'planning',
-                'title': 'Morning Planning',
-                'message': 'Good morning! This is a great time to plan your day.',
-                'action': 'Review your tasks and set priorities for the day',
-                'priority': 'medium'
-            })
-        elif self.user_context.time_of_day == TimeOfDay.EVENING:
-            insights.append({
-                'type': 'reflection',
-                'title': 'Evening Reflection',
-                'message': 'Time to reflect on your day and prepare for tomorrow.',
-                'action': 'Review completed tasks and plan for tomorrow',
-                'priority': 'medium'
-            })
+        if self.user_context.time_of_day is TimeOfDay.MORNING:
+            insights.append(_INSIGHT_MORNING)
+        elif self.user_context.time_of_day is TimeOfDay.EVENING:
+            insights.append(_INSIGHT_EVENING)
         
         # Pattern-based insights
-        if self.patterns:
-            most_common_pattern = max(self.patterns.items(), key=lambda x: x[1]['frequency'])
+        if self._top_pattern_key is not None:
             insights.append({
                 'type': 'pattern',
                 'title': 'Pattern Recognition',
-                'message': f'You\'re most active during {most_common_pattern[0]} periods.',
+                'message': f'You\'re most active during {self._top_pattern_key} periods.',
                 'action': 'Schedule important tasks during your peak times',
                 'priority': 'low'
             })
@@ -324,21 +449,9 @@ class ContextEngine:
         if self.life_metrics:
             overall_score = self._calculate_overall_score()
             if overall_score < 0.4:
-                insights.append({
-                    'type': 'wellness',
-                    'title': 'Life Balance Alert',
-                    'message': 'Your overall life satisfaction is below average. Consider focusing on self-care.',
-                    'action': 'Take time for activities that bring you joy',
-                    'priority': 'high'
-                })
+                insights.append(_INSIGHT_LOW_BALANCE)
             elif overall_score > 0.8:
-                insights.append({
-                    'type': 'celebration',
-                    'title': 'Life Balance Excellent',
-                    'message': 'Your life balance is excellent! Keep up the great work.',
-                    'action': 'Continue your current practices',
-                    'priority': 'low'
-                })
+                insights.append(_INSIGHT_HIGH_BALANCE)
         
         # Store insights for analytics
         self.insights_history.extend(insights)
@@ -347,6 +460,14 @@ class ContextEngine:
     
     def get_analytics(self) -> Dict:
         """Get productivity and life analytics"""
+        if self._static_analytics is None:
+            self._static_analytics = self._build_static_analytics()
+        return {**self._static_analytics, 'recommendations': self._generate_recommendations()}
+    
+    def _build_static_analytics(self) -> Dict:
+        """Build the analytics sections that do not depend on the live context"""
+        # Every section comes from placeholder data, so it is built once per engine;
+        # move a section back into get_analytics once it is backed by real data
         return {
             'productivity_metrics': {
                 'daily_tasks_completed': self._calculate_daily_completion_rate(),
@@ -365,8 +486,7 @@ class ContextEngine:
                 'common_activities': self._identify_common_activities(),
                 'energy_patterns': self._identify_energy_patterns(),
                 'communication_preferences': self._identify_communication_patterns()
-            },
-            'recommendations': self._generate_recommendations()
+            }
         }
     
     def _calculate_daily_completion_rate(self) -> float:
@@ -402,37 +522,30 @@ class ContextEngine:
         """Calculate relationship quality score"""
         return 0.7  # Placeholder
     
-    def _identify_peak_hours(self) -> List[int]:
+    def _identify_peak_hours(self) -> Tuple[int, ...]:
         """Identify peak productivity hours"""
-        return [9, 10, 11, 14, 15]  # Placeholder
+        return _PEAK_HOURS  # Placeholder
     
-    def _identify_common_activities(self) -> List[str]:
+    def _identify_common_activities(self) -> Tuple[str, ...]:
         """Identify most common activities"""
-        return ["email", "meetings", "coding", "planning"]  # Placeholder
+        return _COMMON_ACTIVITIES  # Placeholder
     
     def _identify_energy_patterns(self) -> Dict:
         """Identify energy patterns throughout the day"""
-        return {
-            "morning": "high",
-            "afternoon": "medium",
-            "evening": "low"
-        }
+        return _ENERGY_PATTERNS  # Placeholder
     
     def _identify_communication_patterns(self) -> Dict:
         """Identify communication preferences"""
-        return {
-            "email": 0.4,
-            "slack": 0.3,
-            "phone": 0.2,
-            "in_person": 0.1
-        }
+        return _COMMUNICATION_PATTERNS  # Placeholder
     
     def _generate_recommendations(self) -> List[Dict]:
         """Generate personalized recommendations"""
         recommendations = []
+        completion_rate = self._calculate_daily_completion_rate()
+        work_life_ratio = self._calculate_work_life_ratio()
         
         # Energy optimization
-        if self.user_context.energy_level == EnergyLevel.LOW:
+        if self.user_context.energy_level is EnergyLevel.LOW:
             recommendations.append({
                 'category': 'energy',
                 'title': 'Energy Boost',
@@ -442,7 +555,7 @@ class ContextEngine:
             })
         
         # Productivity optimization
-        if self._calculate_daily_completion_rate() < 0.6:
+        if completion_rate < 0.6:
             recommendations.append({
                 'category': 'productivity',
                 'title': 'Task Prioritization',
@@ -452,7 +565,7 @@ class ContextEngine:
             })
         
         # Life balance
-        if self._calculate_work_life_ratio() > 0.8:
+        if work_life_ratio > 0.8:
             recommendations.append({
                 'category': 'balance',
                 'title': 'Work-Life Balance',
@@ -468,31 +581,11 @@ class ContextEngine:
         if not self.life_metrics:
             self.life_metrics = self._generate_default_life_metrics()
         
-        if hasattr(self.life_metrics, category):
-            current_metrics = getattr(self.life_metrics, category)
-            current_metrics.update(metrics)
-            setattr(self.life_metrics, category, current_metrics)
+        if category in _LM_FIELDS:
+            self.life_metrics[category].update(metrics)
+            self._metrics_version += 1
     
     def get_personalized_suggestions(self, context: str) -> List[str]:
         """Get personalized suggestions based on current context"""
-        suggestions = []
-        
-        if context == "task_planning":
-            if self.user_context.energy_level == EnergyLevel.HIGH:
-                suggestions.append("Focus on your most challenging tasks now")
-            else:
-                suggestions.append("Start with quick, easy tasks to build momentum")
-        
-        elif context == "communication":
-            if self.user_context.time_of_day == TimeOfDay.MORNING:
-                suggestions.append("Send important emails now for better response rates")
-            else:
-                suggestions.append("Use Slack for quick updates, save emails for tomorrow")
-        
-        elif context == "break_planning":
-            if self.user_context.stress_level > 0.7:
-                suggestions.append("Take a longer break - try meditation or a walk")
-            else:
-                suggestions.append("A 5-minute break should be sufficient")
-        
-        return suggestions
+        handler = _SUGGESTION_HANDLERS.get(context)
+        return handler(self.user_context) if handler else []
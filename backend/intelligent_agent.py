@@ -5,10 +5,152 @@ Understands natural language and executes actions automatically
 
 import re
 import json
+import asyncio
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from ai_models import model_manager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed intent/entity replies kept per agent, least recently used evicted first
+_LLM_CACHE_MAX = 4096
+
+# Entities for these categories depend on the conversation, so they are never reused
+_STATEFUL_CATEGORIES = frozenset({'communication', 'social'})
+
+def _entities_key(user_input: str) -> Tuple:
+    return ('entities', user_input.strip().lower())
+
+# Requests phrased tightly enough to fill every entity their action needs; a
+# full match skips the intent and entity model calls. The loose intent_patterns
+# only classify, so they never gate this
+_FAST_PATHS = (
+    ('create_task', re.compile(
+        r'(?:please\s+)?(?:remind me to|(?:add|create) (?:a )?(?:new )?task(?: to)?:?)\s+(?P<title>\S.*?)[.!]?',
+        re.IGNORECASE | re.DOTALL
+    )),
+    ('send_message', re.compile(
+        r'(?:please\s+)?(?:send (?:a )?message to|message|text)\s+(?P<recipient>\w+)\s+saying:?\s+(?P<message>\S.*?)',
+        re.IGNORECASE | re.DOTALL
+    )),
+)
+
+# Whatever follows the first "to" in a request, for the fallback entity parser
+_TO_TAIL = re.compile(r'\bto\s+(?P<tail>\S.*)', re.IGNORECASE | re.DOTALL)
+
+# JSON mode, so intent and entity replies always parse
+_JSON_OBJECT = {"type": "json_object"}
+
+# System turns shared by every call, so each prompt starts with an identical prefix;
+# the per-request details always go in the following user turn
+_SYS_INTENT = {
+    "role": "system",
+    "content": """Classify the user's request. Respond with JSON only:
+{"primary_intent": "string", "confidence": 0-100, "category": "task|communication|social|information|automation|other", "urgency": "low|medium|high"}"""
+}
+_SYS_ENTITIES = {
+    "role": "system",
+    "content": """Extract entities from the user's request for whichever type applies. Respond with JSON only, using these keys:
+task: title, priority (high/medium/low), due_date, category
+meeting: title, attendees, date_time, duration, location
+message: recipient, platform (email/sms/slack), message
+social post: platform, content, hashtags"""
+}
+_SYS_RESPONSE = {
+    "role": "system",
+    "content": """You are Omni, the Universal Life Connector. Reply to the user in a few friendly sentences: confirm the actions that succeeded, explain any that failed with an alternative, and suggest a next step."""
+}
+
+# Output budgets per call; replies are short JSON objects or a few sentences
+_INTENT_MAX_TOKENS = 64
+_ENTITIES_MAX_TOKENS = 256
+_RESPONSE_MAX_TOKENS = 200
+
+def _task_action(entities: Dict) -> Dict:
+    return {
+        'type': 'create_task',
+        'title': entities.get('title', 'New Task'),
+        'priority': entities.get('priority', 'medium'),
+        'due_date': entities.get('due_date'),
+        'category': entities.get('category', 'General')
+    }
+
+def _message_action(entities: Dict) -> Dict:
+    return {
+        'type': 'send_message',
+        'recipient': entities.get('recipient'),
+        'platform': entities.get('platform', 'email'),
+        'message': entities.get('message', 'Hello!'),
+        'subject': entities.get('subject', '')
+    }
+
+def _social_action(entities: Dict) -> Dict:
+    return {
+        'type': 'post_social',
+        'platform': entities.get('platform', 'twitter'),
+        'content': entities.get('content', ''),
+        'hashtags': entities.get('hashtags', [])
+    }
+
+def _search_action(entities: Dict) -> Dict:
+    return {
+        'type': 'search_information',
+        'query': entities.get('query', ''),
+        'source': entities.get('source', 'web')
+    }
+
+def _automation_action(entities: Dict) -> Dict:
+    return {
+        'type': 'create_automation',
+        'trigger': entities.get('trigger', ''),
+        'action': entities.get('action', ''),
+        'conditions': entities.get('conditions', [])
+    }
+
+# Intent category -> builder for the action it leads to
+_ACTION_BUILDERS = {
+    'task': _task_action,
+    'communication': _message_action,
+    'social': _social_action,
+    'information': _search_action,
+    'automation': _automation_action,
+}
+
+# Category of each pattern-matched intent
+_CATEGORY_MAP = MappingProxyType({
+    'create_task': 'task',
+    'schedule_meeting': 'communication',
+    'send_message': 'communication',
+    'post_social': 'social',
+    'check_schedule': 'information',
+    'search_information': 'information',
+    'automate_workflow': 'automation'
+})
+
+# Follow-up suggestions per intent category, at most three each
+_SUGGESTIONS = {
+    'task': (
+        "Would you like me to set a reminder for this task?",
+        "Should I add this to your calendar as well?",
+        "Would you like me to break this down into smaller subtasks?"
+    ),
+    'communication': (
+        "Would you like me to schedule a follow-up reminder?",
+        "Should I add this person to your contacts?",
+        "Would you like me to create a template for similar messages?"
+    ),
+    'social': (
+        "Would you like me to schedule this post for later?",
+        "Should I cross-post this to other platforms?",
+        "Would you like me to suggest relevant hashtags?"
+    ),
+}
+
 class IntelligentAgent:
     """
     Advanced AI agent that understands natural language and executes actions
@@ -19,6 +161,17 @@ class IntelligentAgent:
         self.context_engine = context_engine
         self.automation_engine = automation_engine
         self.model_manager = model_manager
+        self._llm_cache = OrderedDict()
+        self._llm_inflight = {}
+        
+        # Action type -> coroutine that carries it out
+        self._action_handlers = {
+            'create_task': self._create_task,
+            'send_message': self._send_message,
+            'post_social': self._post_social,
+            'search_information': self._search_information,
+            'create_automation': self._create_automation,
+        }
         
         # Intent patterns for common actions
         self.intent_patterns = {
@@ -76,23 +229,25 @@ class IntelligentAgent:
                 r'if.*then'
             ]
         }
+        
+        # All intents in one case-insensitive regex: each intent is a lookahead from the
+        # start of the input, tried in declaration order, and the named group that
+        # matched gives the intent
+        self._intent_regex = re.compile(
+            r'\A(?:' + '|'.join(
+                f'(?=(?s:.*?)(?P<{intent}>{"|".join(patterns)}))'
+                for intent, patterns in self.intent_patterns.items()
+            ) + ')',
+            re.IGNORECASE
+        )
     
     async def process_natural_input(self, user_input: str, context: Dict, session_id: str) -> Dict:
         """
         Process natural language input and execute appropriate actions
         """
         try:
-            # Step 1: Analyze intent using AI
-            intent_analysis = await self._analyze_intent(user_input, context)
-            
-            # Step 2: Extract entities and parameters
-            entities = await self._extract_entities(user_input, intent_analysis)
-            
-            # Step 3: Determine actions to take
-            actions = await self._determine_actions(intent_analysis, entities, context)
-            
-            # Step 4: Execute actions
-            results = await self._execute_actions(actions, context, session_id)
+            # Steps 1-4: Understand the request and execute its actions
+            intent_analysis, entities, results = await self._act_on_input(user_input, context, session_id)
             
             # Step 5: Generate response
             response = await self._generate_response(user_input, intent_analysis, results, context)
@@ -116,29 +271,59 @@ class IntelligentAgent:
                 'context_updated': False
             }
     
+    async def process_natural_input_stream(self, user_input: str, context: Dict, session_id: str):
+        """
+        Process natural language input, execute its actions and stream the reply as text deltas
+        """
+        try:
+            intent_analysis, entities, results = await self._act_on_input(user_input, context, session_id)
+        except Exception as e:
+            yield f"I apologize, but I encountered an error: {str(e)}. Please try rephrasing your request."
+            return
+        
+        streamed = False
+        try:
+            async for delta in self.model_manager.generate_response_stream(
+                messages=self._response_messages(user_input, intent_analysis, results),
+                model_name='glm',
+                temperature=0.7,
+                max_tokens=_RESPONSE_MAX_TOKENS
+            ):
+                streamed = True
+                yield delta
+        except Exception as e:
+            if not streamed:
+                yield self._fallback_response(results)
+    
+    async def _act_on_input(self, user_input: str, context: Dict, session_id: str) -> Tuple[Dict, Dict, List[Dict]]:
+        """Analyze the input, then determine and execute its actions"""
+        # Steps 1 and 2: Analyze intent and extract entities, locally when the
+        # request fully matches a fast path, otherwise with concurrent model calls
+        fast = self._fast_path_analysis(user_input)
+        if fast is not None:
+            intent_analysis, entities = fast
+        else:
+            intent_analysis, entities = await asyncio.gather(
+                self._analyze_intent(user_input, context),
+                self._extract_entities(user_input)
+            )
+            if entities is None:
+                entities = self._fallback_entity_extraction(user_input, intent_analysis)
+            elif intent_analysis.get('category') not in _STATEFUL_CATEGORIES:
+                # Only now is the category known, so only now can the entities be kept
+                self._remember(_entities_key(user_input), entities)
+        
+        # Step 3: Determine actions to take
+        actions = await self._determine_actions(intent_analysis, entities, context)
+        
+        # Step 4: Execute actions
+        results = await self._execute_actions(actions, context, session_id)
+        return intent_analysis, entities, results
+    
     async def _analyze_intent(self, user_input: str, context: Dict) -> Dict:
         """Analyze user intent using AI model"""
         messages = [
-            {
-                "role": "system",
-                "content": """You are an intent analysis expert. Analyze the user's input and determine:
-
-1. PRIMARY INTENT: What does the user want to accomplish?
-2. CONFIDENCE: How confident are you (0-100)?
-3. CATEGORY: Which category best fits (task, communication, social, information, automation, other)?
-4. URGENCY: How urgent is this (low, medium, high)?
-5. CONTEXT_RELEVANCE: How relevant to current context (0-100)?
-
-Respond in JSON format:
-{
-    "primary_intent": "string",
-    "confidence": number,
-    "category": "string",
-    "urgency": "string",
-    "context_relevance": number,
-    "reasoning": "string"
-}"""
-            },
+            _SYS_INTENT,
             {
                 "role": "user",
                 "content": f"""
@@ -157,58 +342,25 @@ Analyze the intent and respond with JSON.
         ]
         
         try:
-            response = await self.model_manager.generate_response(
-                messages=messages,
-                model_name='glm',
-                temperature=0.3
-            )
-            
-            # Parse JSON response
-            intent_data = json.loads(response)
-            return intent_data
+            key = ('intent', user_input.strip().lower(), context.get('current_focus'))
+            return await self._cached_llm(key, messages, _INTENT_MAX_TOKENS)
             
         except Exception as e:
             # Fallback to pattern matching
             return self._fallback_intent_analysis(user_input)
     
-    async def _extract_entities(self, user_input: str, intent_analysis: Dict) -> Dict:
-        """Extract entities and parameters from user input"""
+    async def _extract_entities(self, user_input: str, intent_analysis: Optional[Dict] = None) -> Optional[Dict]:
+        """Extract entities and parameters from user input
+        
+        Runs without an intent so it can overlap intent analysis; if the model
+        fails and no intent was given, returns None for the caller to fall back.
+        """
         messages = [
-            {
-                "role": "system",
-                "content": """You are an entity extraction expert. Extract relevant entities from the user's input:
-
-For TASK creation:
-- title: The task title
-- priority: high/medium/low
-- due_date: When it's due
-- category: Work/Personal/Health/etc
-
-For MEETING scheduling:
-- title: Meeting title
-- attendees: Who to meet with
-- date_time: When to meet
-- duration: How long
-- location: Where to meet
-
-For MESSAGING:
-- recipient: Who to contact
-- platform: email/sms/slack/etc
-- message: What to send
-
-For SOCIAL posting:
-- platform: Which platform
-- content: What to post
-- hashtags: Relevant hashtags
-
-Respond in JSON format with extracted entities.
-"""
-            },
+            _SYS_ENTITIES,
             {
                 "role": "user",
                 "content": f"""
 User Input: "{user_input}"
-Intent: {intent_analysis.get('primary_intent', 'Unknown')}
 
 Extract relevant entities.
 """
@@ -216,120 +368,98 @@ Extract relevant entities.
         ]
         
         try:
-            response = await self.model_manager.generate_response(
-                messages=messages,
-                model_name='glm',
-                temperature=0.3
-            )
-            
-            entities = json.loads(response)
-            return entities
+            key = _entities_key(user_input)
+            if intent_analysis is None:
+                # The category isn't known yet: reuse only replies already kept as
+                # stateless, and leave storing this one to the caller
+                cached = self._recall(key)
+                if cached is not None:
+                    return cached
+                return await self._call_llm(None, messages, _ENTITIES_MAX_TOKENS)
+            if intent_analysis.get('category') in _STATEFUL_CATEGORIES:
+                key = None
+            return await self._cached_llm(key, messages, _ENTITIES_MAX_TOKENS)
             
         except Exception as e:
+            if intent_analysis is None:
+                return None
             return self._fallback_entity_extraction(user_input, intent_analysis)
     
-    async def _determine_actions(self, intent_analysis: Dict, entities: Dict, context: Dict) -> List[Dict]:
-        """Determine what actions to take based on intent and entities"""
-        actions = []
-        category = intent_analysis.get('category', 'other')
-        
-        if category == 'task':
-            actions.append({
-                'type': 'create_task',
-                'title': entities.get('title', 'New Task'),
-                'priority': entities.get('priority', 'medium'),
-                'due_date': entities.get('due_date'),
-                'category': entities.get('category', 'General')
-            })
-        
-        elif category == 'communication':
-            actions.append({
-                'type': 'send_message',
-                'recipient': entities.get('recipient'),
-                'platform': entities.get('platform', 'email'),
-                'message': entities.get('message', 'Hello!'),
-                'subject': entities.get('subject', '')
-            })
-        
-        elif category == 'social':
-            actions.append({
-                'type': 'post_social',
-                'platform': entities.get('platform', 'twitter'),
-                'content': entities.get('content', ''),
-                'hashtags': entities.get('hashtags', [])
-            })
+    async def _cached_llm(self, key: Optional[Tuple], messages: List[Dict], max_tokens: int) -> Dict:
+        """Get a parsed JSON model reply, reusing an earlier one for the same key"""
+        if key is None:
+            return await self._call_llm(None, messages, max_tokens)
         
-        elif category == 'information':
-            actions.append({
-                'type': 'search_information',
-                'query': entities.get('query', ''),
-                'source': entities.get('source', 'web')
-            })
+        cached = self._recall(key)
+        if cached is not None:
+            return cached
         
-        elif category == 'automation':
-            actions.append({
-                'type': 'create_automation',
-                'trigger': entities.get('trigger', ''),
-                'action': entities.get('action', ''),
-                'conditions': entities.get('conditions', [])
-            })
+        # Concurrent requests for the same key share one model call
+        future = self._llm_inflight.get(key)
+        if future is None:
+            future = self._llm_inflight[key] = asyncio.ensure_future(self._call_llm(key, messages, max_tokens))
+            future.add_done_callback(lambda _: self._llm_inflight.pop(key, None))
+        # Shielded so one caller going away doesn't cancel the call for the others
+        return await asyncio.shield(future)
+    
+    async def _call_llm(self, key: Optional[Tuple], messages: List[Dict], max_tokens: int) -> Dict:
+        """Ask the model for a JSON reply and cache the parsed result under key"""
+        response = await self.model_manager.generate_response(
+            messages=messages,
+            model_name='glm',
+            temperature=0.3,
+            max_tokens=max_tokens,
+            response_format=_JSON_OBJECT
+        )
+        result = orjson.loads(response) if orjson else json.loads(response)
         
-        return actions
+        if key is not None:
+            self._remember(key, result)
+        return result
+    
+    def _recall(self, key: Tuple) -> Optional[Dict]:
+        """Get a cached model reply, marking it most recently used"""
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+        return cached
+    
+    def _remember(self, key: Tuple, result: Dict):
+        """Cache a parsed model reply, evicting the least recently used when full"""
+        self._llm_cache[key] = result
+        self._llm_cache.move_to_end(key)
+        if len(self._llm_cache) > _LLM_CACHE_MAX:
+            self._llm_cache.popitem(last=False)
+    
+    async def _determine_actions(self, intent_analysis: Dict, entities: Dict, context: Dict) -> List[Dict]:
+        """Determine what actions to take based on intent and entities"""
+        builder = _ACTION_BUILDERS.get(intent_analysis.get('category', 'other'))
+        return [builder(entities)] if builder else []
     
     async def _execute_actions(self, actions: List[Dict], context: Dict, session_id: str) -> List[Dict]:
-        """Execute the determined actions"""
-        results = []
-        
-        for action in actions:
-            try:
-                if action['type'] == 'create_task':
-                    result = await self._create_task(action, context)
-                    results.append({
-                        'action': 'create_task',
-                        'success': True,
-                        'result': result
-                    })
-                
-                elif action['type'] == 'send_message':
-                    result = await self._send_message(action, context)
-                    results.append({
-                        'action': 'send_message',
-                        'success': True,
-                        'result': result
-                    })
-                
-                elif action['type'] == 'post_social':
-                    result = await self._post_social(action, context)
-                    results.append({
-                        'action': 'post_social',
-                        'success': True,
-                        'result': result
-                    })
-                
-                elif action['type'] == 'search_information':
-                    result = await self._search_information(action, context)
-                    results.append({
-                        'action': 'search_information',
-                        'success': True,
-                        'result': result
-                    })
-                
-                elif action['type'] == 'create_automation':
-                    result = await self._create_automation(action, context)
-                    results.append({
-                        'action': 'create_automation',
-                        'success': True,
-                        'result': result
-                    })
-                
-            except Exception as e:
-                results.append({
-                    'action': action['type'],
-                    'success': False,
-                    'error': str(e)
-                })
+        """Execute the determined actions concurrently"""
+        results = await asyncio.gather(*(self._run_action(action, context) for action in actions))
+        return [result for result in results if result is not None]
+    
+    async def _run_action(self, action: Dict, context: Dict) -> Optional[Dict]:
+        """Execute one action, reporting failure instead of raising; None for unknown types"""
+        handler = self._action_handlers.get(action['type'])
+        if handler is None:
+            return None
+        try:
+            result = await handler(action, context)
+            return {
+                'action': action['type'],
+                'success': True,
+                'result': result
+            }
         
-        return results
+        except Exception as e:
+            return {
+                'action': action['type'],
+                'success': False,
+                'error': str(e)
+            }
     
     async def _create_task(self, action: Dict, context: Dict) -> str:
         """Create a new task"""
@@ -358,21 +488,22 @@ Extract relevant entities.
     
     async def _generate_response(self, user_input: str, intent_analysis: Dict, results: List[Dict], context: Dict) -> str:
         """Generate a natural response to the user"""
-        messages = [
-            {
-                "role": "system",
-                "content": """You are Omni, the Universal Life Connector. Generate a natural, helpful response to the user based on:
-
-1. What they asked for
-2. What actions were taken
-3. The results of those actions
-4. Any suggestions for next steps
-
-Be conversational, helpful, and proactive. If actions were successful, confirm them. If there were issues, explain what happened and suggest alternatives.
-
-Keep responses concise but informative.
-"""
-            },
+        try:
+            response = await self.model_manager.generate_response(
+                messages=self._response_messages(user_input, intent_analysis, results),
+                model_name='glm',
+                temperature=0.7,
+                max_tokens=_RESPONSE_MAX_TOKENS
+            )
+            return response
+            
+        except Exception as e:
+            return self._fallback_response(results)
+    
+    def _response_messages(self, user_input: str, intent_analysis: Dict, results: List[Dict]) -> List[Dict]:
+        """Build the model prompt for the reply to the user"""
+        return [
+            _SYS_RESPONSE,
             {
                 "role": "user",
                 "content": f"""
@@ -384,33 +515,24 @@ Generate a helpful response.
 """
             }
         ]
-        
-        try:
-            response = await self.model_manager.generate_response(
-                messages=messages,
-                model_name='glm',
-                temperature=0.7
-            )
-            return response
-            
-        except Exception as e:
-            return f"I've processed your request and taken the appropriate actions. {len(results)} actions were completed."
+    
+    def _fallback_response(self, results: List[Dict]) -> str:
+        """Reply used when the model can't generate one"""
+        return f"I've processed your request and taken the appropriate actions. {len(results)} actions were completed."
     
     def _fallback_intent_analysis(self, user_input: str) -> Dict:
         """Fallback intent analysis using pattern matching"""
-        user_input_lower = user_input.lower()
-        
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, user_input_lower):
-                    return {
-                        'primary_intent': intent,
-                        'confidence': 70,
-                        'category': self._get_category_from_intent(intent),
-                        'urgency': 'medium',
-                        'context_relevance': 50,
-                        'reasoning': f'Matched pattern: {pattern}'
-                    }
+        match = self._intent_regex.match(user_input)
+        if match:
+            intent = match.lastgroup
+            return {
+                'primary_intent': intent,
+                'confidence': 70,
+                'category': _CATEGORY_MAP.get(intent, 'other'),
+                'urgency': 'medium',
+                'context_relevance': 50,
+                'reasoning': f'Matched pattern: {match.group(intent)}'
+            }
         
         return {
             'primary_intent': 'general_query',
@@ -421,62 +543,40 @@ Generate a helpful response.
             'reasoning': 'No specific pattern matched'
         }
     
+    def _fast_path_analysis(self, user_input: str) -> Optional[Tuple[Dict, Dict]]:
+        """Analyze a request locally when a fast path fills all of its entities"""
+        text = user_input.strip()
+        for intent, pattern in _FAST_PATHS:
+            match = pattern.fullmatch(text)
+            if match:
+                intent_analysis = {
+                    'primary_intent': intent,
+                    'confidence': 90,
+                    'category': _CATEGORY_MAP[intent],
+                    'urgency': 'medium',
+                    'context_relevance': 50,
+                    'reasoning': f'Matched fast path: {intent}'
+                }
+                return intent_analysis, match.groupdict()
+        return None
+    
     def _fallback_entity_extraction(self, user_input: str, intent_analysis: Dict) -> Dict:
         """Fallback entity extraction using simple parsing"""
         entities = {}
+        primary_intent = intent_analysis.get('primary_intent', '')
+        match = _TO_TAIL.search(user_input)
         
         # Extract common entities
-        if 'task' in intent_analysis.get('primary_intent', ''):
+        if 'task' in primary_intent:
             # Try to extract task title
-            if 'to ' in user_input.lower():
-                entities['title'] = user_input.split('to ')[-1].strip()
-            else:
-                entities['title'] = user_input
+            entities['title'] = match.group('tail').strip() if match else user_input
         
-        if 'message' in intent_analysis.get('primary_intent', ''):
+        if 'message' in primary_intent and match:
             # Try to extract recipient
-            if 'to ' in user_input.lower():
-                entities['recipient'] = user_input.split('to ')[1].split()[0]
+            entities['recipient'] = match.group('tail').split(None, 1)[0]
         
         return entities
     
-    def _get_category_from_intent(self, intent: str) -> str:
-        """Map intent to category"""
-        category_map = {
-            'create_task': 'task',
-            'schedule_meeting': 'communication',
-            'send_message': 'communication',
-            'post_social': 'social',
-            'check_schedule': 'information',
-            'search_information': 'information',
-            'automate_workflow': 'automation'
-        }
-        return category_map.get(intent, 'other')
-    
-    def _generate_suggestions(self, intent_analysis: Dict, results: List[Dict]) -> List[str]:
+    def _generate_suggestions(self, intent_analysis: Dict, results: List[Dict]) -> Tuple[str, ...]:
         """Generate helpful suggestions based on the interaction"""
-        suggestions = []
-        category = intent_analysis.get('category', 'other')
-        
-        if category == 'task':
-            suggestions.extend([
-                "Would you like me to set a reminder for this task?",
-                "Should I add this to your calendar as well?",
-                "Would you like me to break this down into smaller subtasks?"
-            ])
-        
-        elif category == 'communication':
-            suggestions.extend([
-                "Would you like me to schedule a follow-up reminder?",
-                "Should I add this person to your contacts?",
-                "Would you like me to create a template for similar messages?"
-            ])
-        
-        elif category == 'social':
-            suggestions.extend([
-                "Would you like me to schedule this post for later?",
-                "Should I cross-post this to other platforms?",
-                "Would you like me to suggest relevant hashtags?"
-            ])
-        
-        return suggestions[:3]  # Return top 3 suggestions
+        return _SUGGESTIONS.get(intent_analysis.get('category', 'other'), ())
@@ -10,8 +10,29 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from abc import ABC, abstractmethod
 import asyncio
+import weakref
 import aiohttp
 
+# Shared HTTP sessions, one per event loop, so connector calls reuse keep-alive connections
+_HTTP = weakref.WeakKeyDictionary()
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session for the running event loop"""
+    loop = asyncio.get_running_loop()
+    session = _HTTP.get(loop)
+    if session is None or session.closed:
+        session = _HTTP[loop] = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60)
+        )
+    return session
+
+async def close_http_session():
+    """Close the shared aiohttp session of the running event loop"""
+    session = _HTTP.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
 class ServiceConnector(ABC):
     """Base class for all service connectors"""
     
@@ -66,12 +87,12 @@ class TodoistConnector(ServiceConnector):
             
             # Test connection
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/projects", headers=headers) as response:
-                    if response.status == 200:
-                        self.connected = True
-                        self.credentials = credentials
-                        return True
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/projects", headers=headers) as response:
+                if response.status == 200:
+                    self.connected = True
+                    self.credentials = credentials
+                    return True
             return False
         except Exception as e:
             print(f"Error connecting to Todoist: {e}")
@@ -89,11 +110,11 @@ class TodoistConnector(ServiceConnector):
         
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/tasks", headers=headers) as response:
-                    if response.status == 200:
-                        tasks = await response.json()
-                        return [self._format_task(task) for task in tasks]
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/tasks", headers=headers) as response:
+                if response.status == 200:
+                    tasks = await response.json()
+                    return [self._format_task(task) for task in tasks]
             return []
         except Exception as e:
             print(f"Error getting Todoist tasks: {e}")
@@ -115,11 +136,11 @@ class TodoistConnector(ServiceConnector):
                 "due_string": task_data.get('due_date', '')
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.base_url}/tasks", headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        task = await response.json()
-                        return self._format_task(task)
+            session = get_http_session()
+            async with session.post(f"{self.base_url}/tasks", headers=headers, json=payload) as response:
+                if response.status == 200:
+                    task = await response.json()
+                    return self._format_task(task)
             return {"error": "Failed to create task"}
         except Exception as e:
             return {"error": f"Error creating Todoist task: {e}"}
@@ -141,11 +162,11 @@ class TodoistConnector(ServiceConnector):
             if 'priority' in updates:
                 payload['priority'] = self._map_priority(updates['priority'])
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.base_url}/tasks/{task_id}", headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        task = await response.json()
-                        return self._format_task(task)
+            session = get_http_session()
+            async with session.post(f"{self.base_url}/tasks/{task_id}", headers=headers, json=payload) as response:
+                if response.status == 200:
+                    task = await response.json()
+                    return self._format_task(task)
             return {"error": "Failed to update task"}
         except Exception as e:
             return {"error": f"Error updating Todoist task: {e}"}
@@ -156,10 +177,10 @@ class TodoistConnector(ServiceConnector):
         
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.base_url}/tasks/{task_id}/close", headers=headers) as response:
-                    if response.status == 204:
-                        return {"success": True, "task_id": task_id}
+            session = get_http_session()
+            async with session.post(f"{self.base_url}/tasks/{task_id}/close", headers=headers) as response:
+                if response.status == 204:
+                    return {"success": True, "task_id": task_id}
             return {"error": "Failed to complete task"}
         except Exception as e:
             return {"error": f"Error completing Todoist task: {e}"}
@@ -201,12 +222,12 @@ class GoogleTasksConnector(ServiceConnector):
             
             # Test connection
             headers = {"Authorization": f"Bearer {self.access_token}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/users/@me/lists", headers=headers) as response:
-                    if response.status == 200:
-                        self.connected = True
-                        self.credentials = credentials
-                        return True
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/users/@me/lists", headers=headers) as response:
+                if response.status == 200:
+                    self.connected = True
+                    self.credentials = credentials
+                    return True
             return False
         except Exception as e:
             print(f"Error connecting to Google Tasks: {e}")
@@ -224,12 +245,12 @@ class GoogleTasksConnector(ServiceConnector):
         
         try:
             headers = {"Authorization": f"Bearer {self.access_token}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/users/@me/lists/@default/tasks", headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        tasks = data.get('items', [])
-                        return [self._format_task(task) for task in tasks]
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/users/@me/lists/@default/tasks", headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    tasks = data.get('items', [])
+                    return [self._format_task(task) for task in tasks]
             return []
         except Exception as e:
             print(f"Error getting Google Tasks: {e}")
@@ -250,11 +271,11 @@ class GoogleTasksConnector(ServiceConnector):
                 "due": task_data.get('due_date')
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.base_url}/users/@me/lists/@default/tasks", headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        task = await response.json()
-                        return self._format_task(task)
+            session = get_http_session()
+            async with session.post(f"{self.base_url}/users/@me/lists/@default/tasks", headers=headers, json=payload) as response:
+                if response.status == 200:
+                    task = await response.json()
+                    return self._format_task(task)
             return {"error": "Failed to create task"}
         except Exception as e:
             return {"error": f"Error creating Google Tasks task: {e}"}
@@ -274,11 +295,11 @@ class GoogleTasksConnector(ServiceConnector):
             if 'description' in updates:
                 payload['notes'] = updates['description']
             
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(f"{self.base_url}/users/@me/lists/@default/tasks/{task_id}", headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        task = await response.json()
-                        return self._format_task(task)
+            session = get_http_session()
+            async with session.patch(f"{self.base_url}/users/@me/lists/@default/tasks/{task_id}", headers=headers, json=payload) as response:
+                if response.status == 200:
+                    task = await response.json()
+                    return self._format_task(task)
             return {"error": "Failed to update task"}
         except Exception as e:
             return {"error": f"Error updating Google Tasks task: {e}"}
@@ -294,11 +315,11 @@ class GoogleTasksConnector(ServiceConnector):
             }
             payload = {"status": "completed"}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(f"{self.base_url}/users/@me/lists/@default/tasks/{task_id}", headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        task = await response.json()
-                        return self._format_task(task)
+            session = get_http_session()
+            async with session.patch(f"{self.base_url}/users/@me/lists/@default/tasks/{task_id}", headers=headers, json=payload) as response:
+                if response.status == 200:
+                    task = await response.json()
+                    return self._format_task(task)
             return {"error": "Failed to complete task"}
         except Exception as e:
             return {"error": f"Error completing Google Tasks task: {e}"}
@@ -333,12 +354,12 @@ class GmailConnector:
             
             # Test connection
             headers = {"Authorization": f"Bearer {self.access_token}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/users/me/profile", headers=headers) as response:
-                    if response.status == 200:
-                        self.connected = True
-                        self.credentials = credentials
-                        return True
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/users/me/profile", headers=headers) as response:
+                if response.status == 200:
+                    self.connected = True
+                    self.credentials = credentials
+                    return True
             return False
         except Exception as e:
             print(f"Error connecting to Gmail: {e}")
@@ -352,12 +373,12 @@ class GmailConnector:
             headers = {"Authorization": f"Bearer {self.access_token}"}
             params = {"q": query, "maxResults": 10}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/users/me/messages", headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        messages = data.get('messages', [])
-                        return [await self._format_message(msg_id) for msg_id in messages]
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/users/me/messages", headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    messages = data.get('messages', [])
+                    return [await self._format_message(msg_id) for msg_id in messages]
             return []
         except Exception as e:
             print(f"Error getting Gmail messages: {e}")
@@ -366,26 +387,26 @@ class GmailConnector:
     async def _format_message(self, msg_id: str) -> Dict:
         try:
             headers = {"Authorization": f"Bearer {self.access_token}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/users/me/messages/{msg_id}", headers=headers) as response:
-                    if response.status == 200:
-                        message = await response.json()
-                        payload = message.get('payload', {})
-                        headers = payload.get('headers', [])
-                        
-                        # Extract common headers
-                        subject = next((h['value'] for h in headers if h['name'] == 'Subject'), '')
-                        sender = next((h['value'] for h in headers if h['name'] == 'From'), '')
-                        date = next((h['value'] for h in headers if h['name'] == 'Date'), '')
-                        
-                        return {
-                            "id": msg_id,
-                            "subject": subject,
-                            "sender": sender,
-                            "date": date,
-                            "service": "gmail",
-                            "unread": 'UNREAD' in message.get('labelIds', [])
-                        }
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/users/me/messages/{msg_id}", headers=headers) as response:
+                if response.status == 200:
+                    message = await response.json()
+                    payload = message.get('payload', {})
+                    headers = payload.get('headers', [])
+                    
+                    # Extract common headers
+                    subject = next((h['value'] for h in headers if h['name'] == 'Subject'), '')
+                    sender = next((h['value'] for h in headers if h['name'] == 'From'), '')
+                    date = next((h['value'] for h in headers if h['name'] == 'Date'), '')
+                    
+                    return {
+                        "id": msg_id,
+                        "subject": subject,
+                        "sender": sender,
+                        "date": date,
+                        "service": "gmail",
+                        "unread": 'UNREAD' in message.get('labelIds', [])
+                    }
         except Exception as e:
             print(f"Error formatting Gmail message: {e}")
             return {}
@@ -407,14 +428,14 @@ class SlackConnector:
             
             # Test connection
             headers = {"Authorization": f"Bearer {self.bot_token}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/auth.test", headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('ok'):
-                            self.connected = True
-                            self.credentials = credentials
-                            return True
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/auth.test", headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get('ok'):
+                        self.connected = True
+                        self.credentials = credentials
+                        return True
             return False
         except Exception as e:
             print(f"Error connecting to Slack: {e}")
@@ -428,12 +449,12 @@ class SlackConnector:
             headers = {"Authorization": f"Bearer {self.bot_token}"}
             params = {"channel": channel, "limit": 10}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/conversations.history", headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        messages = data.get('messages', [])
-                        return [self._format_message(msg) for msg in messages]
+            session = get_http_session()
+            async with session.get(f"{self.base_url}/conversations.history", headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    messages = data.get('messages', [])
+                    return [self._format_message(msg) for msg in messages]
             return []
         except Exception as e:
             print(f"Error getting Slack messages: {e}")
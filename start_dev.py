@@ -15,7 +15,7 @@ def start_backend():
     print("🔧 Starting backend server...")
     try:
         os.chdir('backend')
-        subprocess.run([sys.executable, 'app.py'], check=True)
+        subprocess.run([sys.executable, 'app.py'], check=True, env={**os.environ, 'DEV': '1'})
     except KeyboardInterrupt:
         print("\n🛑 Backend server stopped")
     except subprocess.CalledProcessError as e:
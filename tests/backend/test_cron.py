@@ -0,0 +1,50 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+croniter = pytest.importorskip('croniter').croniter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+from automation_engine import _cron_next_fire, _parse_cron
+
+# Spread across 2020-2030 so leap years and month ends get crossed
+STARTS = [1580515200 + i * 9876543.21 for i in range(36)]
+
+@pytest.mark.parametrize('expression', [
+    '* * * * *',
+    '0 8 * * *',
+    '*/5 9-17 * * 1-5',
+    '0 0 29 2 *',
+    '30 4 1,15 * 5',
+    '0 0 * * 7',
+    '15 3 31 * *',
+    '*/7 */3 */4 */5 *',
+    '0 12 * 6 0-2',
+    '59 23 31 12 *',
+    '5 * 13 * 5',
+    '10-40/10 1,13 * * *',
+])
+def test_cron_next_fire_matches_croniter(expression):
+    for start in STARTS:
+        expected = croniter(expression, datetime.fromtimestamp(start)).get_next(float)
+        assert _cron_next_fire(expression, start) == expected, (expression, datetime.fromtimestamp(start))
+
+@pytest.mark.parametrize('expression', [
+    '',
+    'bogus',
+    '* * * *',
+    '* * * * * *',
+    '60 * * * *',
+    '* 24 * * *',
+    '* * 0 * *',
+    '* * * 13 *',
+    '* * * * 8',
+    '*/0 * * * *',
+    '5-1 * * * *',
+    'a-b * * * *',
+])
+def test_invalid_cron_expressions(expression):
+    assert _parse_cron(expression) is None
+    assert _cron_next_fire(expression, STARTS[0]) is None